@@ -0,0 +1,73 @@
+"""Composite indexes for situation lists
+
+Revision ID: 3f1c2a7d9b10
+Revises:
+Create Date: 2026-10-16 06:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a7d9b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("situations"):
+        # Empty database: init_db creates the table with these indexes.
+        return
+    # CONCURRENTLY cannot run inside a transaction and avoids locking writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_situations_user_id_created_at",
+            "situations",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_situations_child_id_created_at",
+            "situations",
+            ["child_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name in (
+            "ix_situations_user_id",
+            "ix_situations_child_id",
+            "ix_situations_created_at",
+        ):
+            op.drop_index(
+                name,
+                table_name="situations",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("situations"):
+        return
+    with op.get_context().autocommit_block():
+        for column in ("user_id", "child_id", "created_at"):
+            op.create_index(
+                f"ix_situations_{column}",
+                "situations",
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name in (
+            "ix_situations_user_id_created_at",
+            "ix_situations_child_id_created_at",
+        ):
+            op.drop_index(
+                name,
+                table_name="situations",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
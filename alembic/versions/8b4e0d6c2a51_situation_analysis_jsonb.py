@@ -0,0 +1,78 @@
+"""Store situation analysis as one JSONB document
+
+Revision ID: 8b4e0d6c2a51
+Revises: 3f1c2a7d9b10
+Create Date: 2026-10-16 06:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e0d6c2a51'
+down_revision = '3f1c2a7d9b10'
+branch_labels = None
+depends_on = None
+
+ANALYSIS_COLUMNS = (
+    "hidden_meaning",
+    "immediate_actions",
+    "long_term_recommendations",
+    "what_not_to_do",
+    "emotional_tone",
+    "confidence_score",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("situations"):
+        # Empty database: the table is created from the current models.
+        return
+    # Tables created from the current models already have the new layout,
+    # so every step checks what is there rather than assuming the old one.
+    op.execute("ALTER TABLE situations ADD COLUMN IF NOT EXISTS analysis JSONB")
+    columns = {c["name"] for c in sa.inspect(bind).get_columns("situations")}
+    if "hidden_meaning" in columns:
+        # The list columns already hold JSON-encoded text.
+        op.execute(
+            """
+            UPDATE situations SET analysis = jsonb_build_object(
+                'hidden_meaning', hidden_meaning,
+                'immediate_actions', COALESCE(immediate_actions, '[]')::jsonb,
+                'long_term_recommendations', COALESCE(long_term_recommendations, '[]')::jsonb,
+                'what_not_to_do', COALESCE(what_not_to_do, '[]')::jsonb,
+                'emotional_tone', emotional_tone,
+                'confidence_score', confidence_score
+            )
+            WHERE hidden_meaning IS NOT NULL AND hidden_meaning <> ''
+            """
+        )
+    for column in ANALYSIS_COLUMNS:
+        op.execute(f"ALTER TABLE situations DROP COLUMN IF EXISTS {column}")
+
+
+def downgrade() -> None:
+    op.add_column("situations", sa.Column("hidden_meaning", sa.Text(), nullable=True))
+    op.add_column("situations", sa.Column("immediate_actions", sa.Text(), nullable=True))
+    op.add_column(
+        "situations", sa.Column("long_term_recommendations", sa.Text(), nullable=True)
+    )
+    op.add_column("situations", sa.Column("what_not_to_do", sa.Text(), nullable=True))
+    op.add_column("situations", sa.Column("emotional_tone", sa.String(50), nullable=True))
+    op.add_column("situations", sa.Column("confidence_score", sa.Float(), nullable=True))
+    op.execute(
+        """
+        UPDATE situations SET
+            hidden_meaning = analysis->>'hidden_meaning',
+            immediate_actions = (analysis->'immediate_actions')::text,
+            long_term_recommendations = (analysis->'long_term_recommendations')::text,
+            what_not_to_do = (analysis->'what_not_to_do')::text,
+            emotional_tone = analysis->>'emotional_tone',
+            confidence_score = (analysis->>'confidence_score')::float
+        WHERE analysis IS NOT NULL
+        """
+    )
+    op.drop_column("situations", "analysis")
@@ -0,0 +1,39 @@
+"""Server-side defaults for row timestamps
+
+Revision ID: c7d15e9f4b23
+Revises: 8b4e0d6c2a51
+Create Date: 2026-10-16 07:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d15e9f4b23'
+down_revision = '8b4e0d6c2a51'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("situations", "created_at"),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column in TIMESTAMP_COLUMNS:
+        if not inspector.has_table(table):
+            # Empty database: the table is created from the current models.
+            continue
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column in TIMESTAMP_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,52 @@
+"""Store children.gender as a native enum
+
+Revision ID: e2a9c4b7f316
+Revises: c7d15e9f4b23
+Create Date: 2026-10-16 07:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a9c4b7f316'
+down_revision = 'c7d15e9f4b23'
+branch_labels = None
+depends_on = None
+
+gender = postgresql.ENUM("male", "female", "other", name="gender")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("children"):
+        # Empty database: the table and type are created from the current models.
+        return
+    gender.create(bind, checkfirst=True)
+    column = next(
+        c for c in inspector.get_columns("children") if c["name"] == "gender"
+    )
+    if isinstance(column["type"], sa.Enum):
+        # Created from the current models; already the native enum.
+        return
+    op.alter_column(
+        "children",
+        "gender",
+        type_=gender,
+        postgresql_using="gender::gender",
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("children"):
+        return
+    op.alter_column(
+        "children",
+        "gender",
+        type_=sa.String(20),
+        postgresql_using="gender::text",
+    )
+    gender.drop(op.get_bind(), checkfirst=True)
@@ -9,14 +9,14 @@ from uuid import UUID
 from domain.value_objects import Gender
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """Base command."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUserCommand(Command):
     """Register new user command."""
 
@@ -27,7 +27,7 @@ class RegisterUserCommand(Command):
     language_code: Optional[str] = "ru"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddChildCommand(Command):
     """Add child to user command."""
 
@@ -38,14 +38,14 @@ class AddChildCommand(Command):
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompleteOnboardingCommand(Command):
     """Complete user onboarding command."""
 
     user_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeSituationCommand(Command):
     """Analyze situation command."""
 
@@ -55,14 +55,14 @@ class AnalyzeSituationCommand(Command):
     context: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetUserCommand(Command):
     """Get user by telegram ID command."""
 
     telegram_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetSituationCommand(Command):
     """Get situation by ID command."""
 
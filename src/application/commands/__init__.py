@@ -7,13 +7,13 @@ from typing import Optional
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """Base command."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUserCommand(Command):
     """Register new user command."""
     telegram_id: int
@@ -23,7 +23,7 @@ class RegisterUserCommand(Command):
     language_code: Optional[str] = "ru"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddChildCommand(Command):
     """Add child to user command."""
     user_id: UUID
@@ -33,13 +33,13 @@ class AddChildCommand(Command):
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompleteOnboardingCommand(Command):
     """Complete user onboarding command."""
     user_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeSituationCommand(Command):
     """Analyze situation command."""
     user_id: UUID
@@ -48,13 +48,13 @@ class AnalyzeSituationCommand(Command):
     context: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetUserCommand(Command):
     """Get user by telegram ID command."""
     telegram_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetSituationCommand(Command):
     """Get situation by ID command."""
     situation_id: UUID
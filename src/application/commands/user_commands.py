@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUserCommand:
     """Command to register a new user."""
     
@@ -16,7 +16,7 @@ class RegisterUserCommand:
     child_gender: str = "not_specified"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddChildCommand:
     """Command to add a child to user's family."""
     
@@ -1,16 +1,130 @@
 """Application DTOs."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import Field, FrozenInstanceError, dataclass, fields
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar, Union, overload
 from uuid import UUID
 
 from domain.value_objects import EmotionalTone, Gender
 
+_T = TypeVar("_T")
 
-@dataclass(frozen=True)
-class ChildDTO:
+_object_setattr = object.__setattr__
+
+_FIELDS_CACHE: dict[type, tuple[Field[Any], ...]] = {}
+
+
+def cached_fields(cls: type) -> tuple[Field[Any], ...]:
+    """Return ``dataclasses.fields(cls)``, computed once per class."""
+    try:
+        return _FIELDS_CACHE[cls]
+    except KeyError:
+        return _FIELDS_CACHE.setdefault(cls, fields(cls))
+
+
+@overload
+def immutable(cls: type[_T], /) -> type[_T]: ...
+
+
+@overload
+def immutable(*, eq: bool = True) -> Callable[[type[_T]], type[_T]]: ...
+
+
+def immutable(
+    cls: Optional[type[_T]] = None, /, *, eq: bool = True
+) -> Union[type[_T], Callable[[type[_T]], type[_T]]]:
+    """Build a slotted dataclass whose instances become read-only after init.
+
+    ``frozen=True`` routes every field assignment in the generated
+    ``__init__`` through ``object.__setattr__``. Here ``__init__`` uses plain
+    slot assignment and ``__post_init__`` then swaps the instance's class to
+    a sibling with the same slot layout whose ``__setattr__``/``__delattr__``
+    raise ``FrozenInstanceError``.
+
+    Pickling (e.g. into the Redis FSM storage) goes through generated
+    ``__getstate__``/``__setstate__`` that pack the fields into a flat tuple.
+
+    With ``eq=False`` no field-wise ``__eq__``/``__hash__`` is generated and
+    instances compare and hash by identity.
+    """
+    if cls is None:
+        return lambda cls: _make_immutable(cls, eq)
+    return _make_immutable(cls, eq)
+
+
+def _make_immutable(cls: type[_T], eq: bool) -> type[_T]:
+    """Apply :func:`immutable` to ``cls``."""
+    frozen: type[_T]
+
+    def __post_init__(self: Any) -> None:
+        _object_setattr(self, "__class__", frozen)
+
+    cls.__post_init__ = __post_init__  # type: ignore[attr-defined]
+    base = dataclass(slots=True, eq=eq, unsafe_hash=eq)(cls)
+    names = tuple(f.name for f in cached_fields(base))
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        # Reached via ``dataclasses.replace`` on an already frozen instance.
+        _object_setattr(self, "__class__", base)
+        base.__init__(self, *args, **kwargs)
+
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self: Any, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self: Any) -> tuple[Any, ...]:
+        return object.__new__, (base,), self.__getstate__()
+
+    base.__reduce__ = __reduce__  # type: ignore[assignment]
+    frozen = type(
+        base.__name__,
+        (base,),
+        {
+            "__slots__": (),
+            "__module__": base.__module__,
+            "__qualname__": base.__qualname__,
+            "__doc__": base.__doc__,
+            "__init__": __init__,
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+        },
+    )
+    _add_state_methods(base, names, frozen)
+    return base
+
+
+def _add_state_methods(cls: type, names: tuple[str, ...], frozen: type) -> None:
+    """Attach ``__getstate__``/``__setstate__`` specialised for ``names``."""
+    targets = ", ".join(f"self.{name}" for name in names)
+    source = (
+        "def __getstate__(self):\n"
+        f"    return ({targets},)\n"
+        "def __setstate__(self, state):\n"
+        f"    ({targets},) = state\n"
+        "    _object_setattr(self, '__class__', frozen)\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, {"_object_setattr": _object_setattr, "frozen": frozen}, namespace)
+    for name, fn in namespace.items():
+        fn.__qualname__ = f"{cls.__qualname__}.{name}"
+        setattr(cls, name, fn)
+
+
+class _FastDict:
+    """Mixin adding a shallow ``to_dict`` backed by :func:`cached_fields`."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a shallow ``{field: value}`` mapping of the DTO."""
+        return {f.name: getattr(self, f.name) for f in cached_fields(type(self))}
+
+
+@immutable
+class ChildDTO(_FastDict):
     """Child DTO."""
 
     id: UUID
@@ -23,8 +137,8 @@ class ChildDTO:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
-class UserDTO:
+@immutable(eq=False)
+class UserDTO(_FastDict):
     """User DTO."""
 
     id: UUID
@@ -33,27 +147,14 @@ class UserDTO:
     first_name: str
     last_name: Optional[str]
     full_name: str
-    children: list[ChildDTO]
+    children: tuple[ChildDTO, ...]
     onboarding_completed: bool
     created_at: datetime
     is_active: bool
 
 
-@dataclass(frozen=True)
-class AnalysisResultDTO:
-    """Analysis result DTO."""
-
-    hidden_meaning: str
-    immediate_actions: list[str]
-    long_term_recommendations: list[str]
-    what_not_to_do: list[str]
-    emotional_tone: EmotionalTone
-    confidence_score: float
-    analyzed_at: datetime
-
-
-@dataclass(frozen=True)
-class SituationDTO:
+@immutable(eq=False)
+class SituationDTO(_FastDict):
     """Situation DTO."""
 
     id: UUID
@@ -62,14 +163,19 @@ class SituationDTO:
     child_name: str
     description: str
     context: Optional[str]
-    analysis_result: Optional[AnalysisResultDTO]
     created_at: datetime
     analyzed_at: Optional[datetime]
     is_analyzed: bool
+    hidden_meaning: Optional[str] = None
+    immediate_actions: tuple[str, ...] = ()
+    long_term_recommendations: tuple[str, ...] = ()
+    what_not_to_do: tuple[str, ...] = ()
+    emotional_tone: Optional[EmotionalTone] = None
+    confidence_score: Optional[float] = None
 
 
-@dataclass(frozen=True)
-class OnboardingStatusDTO:
+@dataclass(frozen=True, slots=True, eq=False)
+class OnboardingStatusDTO(_FastDict):
     """Onboarding status DTO."""
 
     completed: bool
@@ -1,7 +1,8 @@
 """Analysis service."""
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from operator import itemgetter
+from typing import Final, Optional, Protocol
 from uuid import UUID
 
 from domain.aggregates.situation import Situation
@@ -14,7 +15,15 @@ from domain.repositories.situation import SituationRepository
 from domain.repositories.user import UserRepository
 from domain.value_objects import EmotionalTone
 from application.commands import AnalyzeSituationCommand, GetSituationCommand
-from application.dto import AnalysisResultDTO, SituationDTO
+from application.dto import SituationDTO
+
+_ANALYSIS_FIELDS = itemgetter(
+    "hidden_meaning",
+    "immediate_actions",
+    "long_term_recommendations",
+    "what_not_to_do",
+    "emotional_tone",
+)
 
 
 class ClaudeAdapter(Protocol):
@@ -44,6 +53,8 @@ class AnalysisService:
         self.user_repository = user_repository
         self.situation_repository = situation_repository
         self.claude_adapter = claude_adapter
+        # Bound once so the hot path skips the attribute lookup per request.
+        self._analyze_with_claude: Final = claude_adapter.analyze_situation
 
     async def analyze_situation(
         self, command: AnalyzeSituationCommand
@@ -71,22 +82,32 @@ class AnalysisService:
             context=command.context,
         )
 
+        child_age = str(child.age)
+
         # Analyze with Claude
         try:
-            analysis_result = await self.claude_adapter.analyze_situation(
+            analysis_result = await self._analyze_with_claude(
                 situation=command.description,
-                child_age=str(child.age),
-                child_gender=child.gender.value,
+                child_age=child_age,
+                child_gender=child.gender,
                 context=command.context,
             )
 
+            (
+                hidden_meaning,
+                immediate_actions,
+                long_term_recommendations,
+                what_not_to_do,
+                emotional_tone,
+            ) = _ANALYSIS_FIELDS(analysis_result)
+
             # Apply analysis to situation
             situation.apply_analysis(
-                hidden_meaning=analysis_result["hidden_meaning"],
-                immediate_actions=analysis_result["immediate_actions"],
-                long_term_recommendations=analysis_result["long_term_recommendations"],
-                what_not_to_do=analysis_result["what_not_to_do"],
-                emotional_tone=EmotionalTone(analysis_result["emotional_tone"]),
+                hidden_meaning=hidden_meaning,
+                immediate_actions=immediate_actions,
+                long_term_recommendations=long_term_recommendations,
+                what_not_to_do=what_not_to_do,
+                emotional_tone=EmotionalTone(emotional_tone),
                 confidence_score=analysis_result.get("confidence_score", 0.8),
             )
 
@@ -120,35 +141,29 @@ class AnalysisService:
         self, user_id: UUID, limit: int = 10, offset: int = 0
     ) -> list[SituationDTO]:
         """Get user's situations."""
-        situations = await self.situation_repository.get_user_situations(
+        rows = await self.situation_repository.get_user_situations_with_child_names(
             user_id, limit, offset
         )
 
-        # Get user to find child names
-        user = await self.user_repository.get(user_id)
-        if not user:
-            return []
-
-        result = []
-        for situation in situations:
-            child = user.get_child(situation.child_id)
-            child_name = child.name if child else "Unknown"
-            result.append(self._to_dto(situation, child_name))
-
-        return result
+        return [
+            self._to_dto(situation, child_name or "Unknown")
+            for situation, child_name in rows
+        ]
 
     def _to_dto(self, situation: Situation, child_name: str) -> SituationDTO:
         """Convert situation to DTO."""
-        analysis_dto = None
-        if situation.analysis_result:
-            analysis_dto = AnalysisResultDTO(
-                hidden_meaning=situation.analysis_result.hidden_meaning,
-                immediate_actions=situation.analysis_result.immediate_actions,
-                long_term_recommendations=situation.analysis_result.long_term_recommendations,
-                what_not_to_do=situation.analysis_result.what_not_to_do,
-                emotional_tone=situation.analysis_result.emotional_tone,
-                confidence_score=situation.analysis_result.confidence_score,
-                analyzed_at=situation.analysis_result.analyzed_at,
+        result = situation.analysis_result
+        if result is None:
+            return SituationDTO(
+                id=situation.id,
+                user_id=situation.user_id,
+                child_id=situation.child_id,
+                child_name=child_name,
+                description=situation.description,
+                context=situation.context,
+                created_at=situation.created_at,
+                analyzed_at=None,
+                is_analyzed=False,
             )
 
         return SituationDTO(
@@ -158,8 +173,13 @@ class AnalysisService:
             child_name=child_name,
             description=situation.description,
             context=situation.context,
-            analysis_result=analysis_dto,
             created_at=situation.created_at,
-            analyzed_at=situation.analyzed_at,
-            is_analyzed=situation.is_analyzed,
-        )
\ No newline at end of file
+            analyzed_at=result.analyzed_at,
+            is_analyzed=True,
+            hidden_meaning=result.hidden_meaning,
+            immediate_actions=tuple(result.immediate_actions),
+            long_term_recommendations=tuple(result.long_term_recommendations),
+            what_not_to_do=tuple(result.what_not_to_do),
+            emotional_tone=result.emotional_tone,
+            confidence_score=result.confidence_score,
+        )
@@ -22,6 +22,9 @@ class UserService:
     def __init__(self, user_repository: UserRepository) -> None:
         """Initialize user service."""
         self.user_repository = user_repository
+        # Services live for a single handler call, so this only dedups
+        # repeated lookups of the same user within one request.
+        self._users_by_telegram_id: dict[int, UserDTO] = {}
 
     async def register_user(self, command: RegisterUserCommand) -> UserDTO:
         """Register new user."""
@@ -60,6 +63,7 @@ class UserService:
 
         # Save user
         await self.user_repository.save(user)
+        self._users_by_telegram_id.pop(user.telegram_user.telegram_id, None)
 
         return self._child_to_dto(child)
 
@@ -86,6 +90,7 @@ class UserService:
 
         # Save user
         await self.user_repository.save(user)
+        self._users_by_telegram_id.pop(user.telegram_user.telegram_id, None)
 
         logger.info("After save", 
                    user_id=str(user.id), 
@@ -95,11 +100,7 @@ class UserService:
 
     async def get_user(self, command: GetUserCommand) -> Optional[UserDTO]:
         """Get user by telegram ID."""
-        user = await self.user_repository.get_by_telegram_id(command.telegram_id)
-        if not user:
-            return None
-
-        return self._to_dto(user)
+        return await self.get_user_by_telegram_id(command.telegram_id)
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[UserDTO]:
         """Get user by ID."""
@@ -111,11 +112,17 @@ class UserService:
 
     async def get_user_by_telegram_id(self, telegram_id: int) -> Optional[UserDTO]:
         """Get user by telegram ID."""
+        cached = self._users_by_telegram_id.get(telegram_id)
+        if cached is not None:
+            return cached
+
         user = await self.user_repository.get_by_telegram_id(telegram_id)
         if not user:
             return None
 
-        return self._to_dto(user)
+        dto = self._to_dto(user)
+        self._users_by_telegram_id[telegram_id] = dto
+        return dto
 
     def _to_dto(self, user: User) -> UserDTO:
         """Convert user to DTO."""
@@ -126,22 +133,31 @@ class UserService:
             first_name=user.telegram_user.first_name,
             last_name=user.telegram_user.last_name,
             full_name=user.telegram_user.full_name,
-            children=[self._child_to_dto(child) for child in user.children],
+            children=self._children_to_dto(user),
             onboarding_completed=user.onboarding_completed,
             created_at=user.created_at,
             is_active=user.is_active,
         )
 
+    def _children_to_dto(self, user: User) -> tuple[ChildDTO, ...]:
+        """Convert user's children to DTOs, reusing the aggregate's cache."""
+        children = user._children_dto_cache
+        if children is None:
+            children = user._children_dto_cache = tuple(
+                self._child_to_dto(child) for child in user.children
+            )
+        return children
+
     def _child_to_dto(self, child) -> ChildDTO:
         """Convert child to DTO."""
-        age = child.age
+        years, months, age_group = child.age_parts
         return ChildDTO(
             id=child.id,
             name=child.name,
             birth_date=child.birth_date,
             gender=child.gender,
-            age_years=age.years,
-            age_months=age.months or 0,
-            age_group=age.age_group,
+            age_years=years,
+            age_months=months,
+            age_group=age_group,
             notes=child.notes,
         )
\ No newline at end of file
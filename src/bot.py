@@ -16,6 +16,9 @@ from redis.asyncio import Redis
 sys.path.append(str(Path(__file__).parent))
 
 from config import settings
+from infrastructure.cache.redis import close_redis
+from infrastructure.claude.adapter import close_anthropic_client
+from infrastructure.database.migrate import init_schema
 from infrastructure.database.session import db_manager
 from presentation.handlers import analysis, start, translator, menu
 
@@ -38,13 +41,15 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+DEFAULT_BOT_PROPERTIES = DefaultBotProperties(parse_mode=ParseMode.MARKDOWN)
+
 
 async def on_startup(bot: Bot) -> None:
     """Actions to perform on bot startup."""
     logger.info("Bot starting...")
     
-    # Create database tables
-    await db_manager.create_all()
+    # Create missing tables and apply pending migrations
+    await init_schema()
     logger.info("Database initialized")
     
     # Get bot info
@@ -63,23 +68,30 @@ async def on_shutdown(bot: Bot) -> None:
     # Close database connections
     await db_manager.close()
     logger.info("Database connections closed")
+
+    # Close the shared Claude HTTP pool and the user-cache Redis client
+    await close_anthropic_client()
+    await close_redis()
     
     logger.info("Bot stopped")
 
 
 async def main() -> None:
     """Main bot function."""
-    # Initialize Redis storage for FSM
+    # Initialize Redis storage for FSM on a bounded, keep-alive pool
     redis = Redis.from_url(
         str(settings.redis_url),
         decode_responses=True,
+        max_connections=settings.redis_pool_size,
+        socket_keepalive=True,
+        health_check_interval=30,
     )
     storage = RedisStorage(redis=redis)
     
     # Initialize bot and dispatcher
     bot = Bot(
         token=settings.bot_token,
-        default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN),
+        default=DEFAULT_BOT_PROPERTIES,
     )
     dp = Dispatcher(storage=storage)
     
@@ -1,7 +1,7 @@
 """Application configuration module."""
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Bot Configuration
@@ -28,26 +29,29 @@ class Settings(BaseSettings):
     postgres_user: str = Field(default="family_bot")
     postgres_password: str = Field(default="changeme")
     
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct database URL from components."""
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
     
     database_pool_size: int = Field(default=20)
     database_max_overflow: int = Field(default=10)
+    database_pool_recycle: int = Field(default=1800)
     database_echo: bool = Field(default=False)
+    database_statement_cache_size: int = Field(default=1024)
 
     # Redis Configuration
     redis_host: str = Field(default="localhost")
     redis_port: int = Field(default=6379)
     redis_db: int = Field(default=0)
     
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Construct Redis URL from components."""
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
     
     redis_pool_size: int = Field(default=10)
+    user_cache_ttl: int = Field(default=120)
 
     # Application Settings
     log_level: str = Field(default="INFO")
@@ -60,10 +64,16 @@ class Settings(BaseSettings):
     claude_temperature: float = Field(default=0.7)
     claude_retry_attempts: int = Field(default=3)
     claude_timeout: int = Field(default=30)
+    claude_total_deadline: int = Field(default=60)
+    claude_max_connections: int = Field(default=20)
+    claude_max_keepalive: int = Field(default=10)
+    claude_max_backoff: float = Field(default=8.0)
+    claude_circuit_failure_threshold: int = Field(default=5)
+    claude_circuit_recovery_time: int = Field(default=30)
     
     # Rate Limiting
-    max_requests_per_user_per_day: int = Field(default=100)
-    max_requests_per_user_per_hour: int = Field(default=10)
+    max_requests_per_user_per_day: int = Field(default=100, ge=0)
+    max_requests_per_user_per_hour: int = Field(default=10, ge=0)
 
 
 @lru_cache
@@ -3,15 +3,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, Optional, Sequence
 from uuid import UUID, uuid4
 
 from domain.domain_events import DomainEvent, SituationAnalyzed
 from domain.exceptions import InvalidSituationException
 from domain.value_objects import AnalysisResult, EmotionalTone
 
+_utcnow = partial(datetime.now, timezone.utc)
 
-@dataclass
+MIN_DESCRIPTION_LENGTH = 10
+MAX_DESCRIPTION_LENGTH = 2000
+
+
+@dataclass(slots=True)
 class Situation:
     """Situation aggregate for analysis."""
 
@@ -21,12 +27,13 @@ class Situation:
     description: str
     context: Optional[str] = None
     analysis_result: Optional[AnalysisResult] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    analyzed_at: Optional[datetime] = None
-    _events: list[DomainEvent] = field(default_factory=list, init=False)
+    created_at: datetime = field(default_factory=_utcnow)
+    _events: Optional[list[tuple[type[DomainEvent], dict[str, Any]]]] = field(
+        default=None, init=False
+    )
 
-    MIN_DESCRIPTION_LENGTH = 10
-    MAX_DESCRIPTION_LENGTH = 2000
+    MIN_DESCRIPTION_LENGTH = MIN_DESCRIPTION_LENGTH
+    MAX_DESCRIPTION_LENGTH = MAX_DESCRIPTION_LENGTH
 
     @classmethod
     def create(
@@ -37,14 +44,15 @@ class Situation:
         context: Optional[str] = None,
     ) -> Situation:
         """Create new situation for analysis."""
-        if len(description) < cls.MIN_DESCRIPTION_LENGTH:
+        length = len(description)
+        if length < MIN_DESCRIPTION_LENGTH:
             raise InvalidSituationException(
-                f"Description must be at least {cls.MIN_DESCRIPTION_LENGTH} characters"
+                f"Description must be at least {MIN_DESCRIPTION_LENGTH} characters"
             )
 
-        if len(description) > cls.MAX_DESCRIPTION_LENGTH:
+        if length > MAX_DESCRIPTION_LENGTH:
             raise InvalidSituationException(
-                f"Description must not exceed {cls.MAX_DESCRIPTION_LENGTH} characters"
+                f"Description must not exceed {MAX_DESCRIPTION_LENGTH} characters"
             )
 
         return cls(
@@ -58,9 +66,9 @@ class Situation:
     def apply_analysis(
         self,
         hidden_meaning: str,
-        immediate_actions: list[str],
-        long_term_recommendations: list[str],
-        what_not_to_do: list[str],
+        immediate_actions: Sequence[str],
+        long_term_recommendations: Sequence[str],
+        what_not_to_do: Sequence[str],
         emotional_tone: EmotionalTone,
         confidence_score: float = 0.8,
     ) -> None:
@@ -68,40 +76,57 @@ class Situation:
         if self.analysis_result:
             raise InvalidSituationException("Situation already analyzed")
 
+        now = _utcnow()
         self.analysis_result = AnalysisResult(
             hidden_meaning=hidden_meaning,
-            immediate_actions=immediate_actions,
-            long_term_recommendations=long_term_recommendations,
-            what_not_to_do=what_not_to_do,
+            # Copy into tuples so later changes to the caller's lists
+            # cannot reach the stored result
+            immediate_actions=tuple(immediate_actions),
+            long_term_recommendations=tuple(long_term_recommendations),
+            what_not_to_do=tuple(what_not_to_do),
             emotional_tone=emotional_tone,
             confidence_score=confidence_score,
-            analyzed_at=datetime.now(timezone.utc),
+            analyzed_at=now,
         )
 
-        self.analyzed_at = datetime.now(timezone.utc)
-
         self._add_event(
-            SituationAnalyzed(
-                aggregate_id=self.id,
-                situation_id=self.id,
-                child_id=self.child_id,
-                situation_text=self.description,
-                emotional_tone=emotional_tone,
-                confidence_score=confidence_score,
-            )
+            SituationAnalyzed,
+            occurred_at=now,
+            aggregate_id=self.id,
+            situation_id=self.id,
+            child_id=self.child_id,
+            situation_text=self.description,
+            emotional_tone=emotional_tone,
+            confidence_score=confidence_score,
         )
 
+    @property
+    def analyzed_at(self) -> Optional[datetime]:
+        """Get analysis timestamp."""
+        result = self.analysis_result
+        return result.analyzed_at if result is not None else None
+
     @property
     def is_analyzed(self) -> bool:
         """Check if situation has been analyzed."""
         return self.analysis_result is not None
 
-    def _add_event(self, event: DomainEvent) -> None:
-        """Add domain event."""
-        self._events.append(event)
+    def _add_event(self, event_type: type[DomainEvent], **fields: Any) -> None:
+        """Record a domain event; it is built when events are collected."""
+        pending = (event_type, fields)
+        events = self._events
+        if events is None:
+            self._events = [pending]
+        else:
+            events.append(pending)
 
     def collect_events(self) -> list[DomainEvent]:
         """Collect and clear events."""
-        events = self._events.copy()
-        self._events.clear()
-        return events
\ No newline at end of file
+        events, self._events = self._events, None
+        if events is None:
+            return []
+        return [event_type(**fields) for event_type, fields in events]
+
+    def clear_events(self) -> None:
+        """Drop pending events without building them."""
+        self._events = None
\ No newline at end of file
@@ -3,15 +3,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
 from domain.domain_events import ChildAdded, DomainEvent, OnboardingCompleted, UserRegistered
 from domain.exceptions import ChildLimitExceededException, DomainException
 from domain.value_objects import Child, Gender, TelegramUser
 
+_utcnow = partial(datetime.now, timezone.utc)
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """User aggregate root."""
 
@@ -19,13 +22,28 @@ class User:
     telegram_user: TelegramUser
     children: list[Child] = field(default_factory=list)
     onboarding_completed: bool = False
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     is_active: bool = True
-    _events: list[DomainEvent] = field(default_factory=list, init=False)
+    _events: Optional[list[tuple[type[DomainEvent], dict[str, Any]]]] = field(
+        default=None, init=False
+    )
+    # Read-model projection of ``children`` memoized by the application layer;
+    # reset whenever the children list changes.
+    _children_dto_cache: Optional[tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Index over ``children`` for O(1) lookups; kept in sync by the mutators.
+    _children_by_id: dict[UUID, Child] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     MAX_CHILDREN = 10
 
+    def __post_init__(self) -> None:
+        """Index children passed in on reconstitution."""
+        self._children_by_id = {child.id: child for child in self.children}
+
     @classmethod
     def create(
         cls,
@@ -37,6 +55,7 @@ class User:
     ) -> User:
         """Create new user aggregate."""
         user_id = uuid4()
+        now = _utcnow()
         telegram_user = TelegramUser(
             telegram_id=telegram_id,
             username=username,
@@ -48,16 +67,18 @@ class User:
         user = cls(
             id=user_id,
             telegram_user=telegram_user,
+            created_at=now,
+            updated_at=now,
         )
 
         user._add_event(
-            UserRegistered(
-                aggregate_id=user_id,
-                telegram_id=telegram_id,
-                username=username,
-                first_name=first_name,
-                language_code=language_code or "ru",
-            )
+            UserRegistered,
+            occurred_at=now,
+            aggregate_id=user_id,
+            telegram_id=telegram_id,
+            username=username,
+            first_name=first_name,
+            language_code=language_code or "ru",
         )
 
         return user
@@ -85,25 +106,36 @@ class User:
             notes=notes,
         )
 
+        now = _utcnow()
         self.children.append(child)
-        self.updated_at = datetime.now(timezone.utc)
+        self._children_by_id[child_id] = child
+        self._children_dto_cache = None
+        self.updated_at = now
 
         self._add_event(
-            ChildAdded(
-                aggregate_id=self.id,
-                child_id=child_id,
-                child_name=name,
-                birth_date=birth_date.isoformat(),
-                gender=gender,
-            )
+            ChildAdded,
+            occurred_at=now,
+            aggregate_id=self.id,
+            child_id=child_id,
+            child_name=name,
+            birth_date=birth_date.isoformat(),
+            gender=gender,
         )
 
         return child
 
     def remove_child(self, child_id: UUID) -> None:
         """Remove child from user."""
-        self.children = [c for c in self.children if c.id != child_id]
-        self.updated_at = datetime.now(timezone.utc)
+        child = self._children_by_id.pop(child_id, None)
+        if child is None:
+            return
+
+        for index, existing in enumerate(self.children):
+            if existing is child:
+                del self.children[index]
+                break
+        self._children_dto_cache = None
+        self.updated_at = _utcnow()
 
     def complete_onboarding(self) -> None:
         """Mark onboarding as completed."""
@@ -113,36 +145,47 @@ class User:
         if not self.children:
             raise DomainException("Add at least one child to complete onboarding")
 
+        now = _utcnow()
         self.onboarding_completed = True
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now
 
         self._add_event(
-            OnboardingCompleted(
-                aggregate_id=self.id,
-                children_count=len(self.children),
-            )
+            OnboardingCompleted,
+            occurred_at=now,
+            aggregate_id=self.id,
+            children_count=len(self.children),
         )
 
     def get_child(self, child_id: UUID) -> Optional[Child]:
         """Get child by ID."""
-        return next((c for c in self.children if c.id == child_id), None)
+        return self._children_by_id.get(child_id)
 
     def deactivate(self) -> None:
         """Deactivate user."""
         self.is_active = False
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow()
 
     def activate(self) -> None:
         """Activate user."""
         self.is_active = True
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow()
 
-    def _add_event(self, event: DomainEvent) -> None:
-        """Add domain event."""
-        self._events.append(event)
+    def _add_event(self, event_type: type[DomainEvent], **fields: Any) -> None:
+        """Record a domain event; it is built when events are collected."""
+        pending = (event_type, fields)
+        events = self._events
+        if events is None:
+            self._events = [pending]
+        else:
+            events.append(pending)
 
     def collect_events(self) -> list[DomainEvent]:
         """Collect and clear events."""
-        events = self._events.copy()
-        self._events.clear()
-        return events
\ No newline at end of file
+        events, self._events = self._events, None
+        if events is None:
+            return []
+        return [event_type(**fields) for event_type, fields in events]
+
+    def clear_events(self) -> None:
+        """Drop pending events without building them."""
+        self._events = None
\ No newline at end of file
@@ -1,25 +1,28 @@
 """Analysis aggregate root and related entities."""
+from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from enum import IntEnum
 from uuid import UUID, uuid4
 
 from src.domain.analysis.value_objects import SituationDescription
 from src.domain.analysis.events import AnalysisRequested, AnalysisCompleted
 
 
-class AnalysisStatus(Enum):
-    """Analysis status enumeration."""
+class AnalysisStatus(IntEnum):
+    """Analysis status enumeration.
+
+    Persisted by lower-cased member name (``"pending"``, ...).
+    """
     
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    PENDING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    FAILED = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class AIRecommendation:
     """AI-generated recommendation value object."""
     
@@ -34,7 +37,7 @@ class AIRecommendation:
             raise ValueError("Confidence score must be between 0 and 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class Analysis:
     """Analysis aggregate root."""
     
@@ -45,11 +48,11 @@ class Analysis:
         default_factory=lambda: SituationDescription("")
     )
     status: AnalysisStatus = AnalysisStatus.PENDING
-    recommendation: Optional[AIRecommendation] = None
+    recommendation: AIRecommendation | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
-    completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
-    _events: list = field(default_factory=list, init=False, repr=False)
+    completed_at: datetime | None = None
+    error_message: str | None = None
+    _events: list | None = field(default=None, init=False, repr=False)
     
     @classmethod
     def create(
@@ -66,39 +69,37 @@ class Analysis:
             status=AnalysisStatus.PENDING
         )
         
-        analysis._events.append(
-            AnalysisRequested(
-                analysis_id=analysis.id,
-                user_id=user_id,
-                child_id=child_id,
-                situation=situation_text,
-                timestamp=analysis.created_at
-            )
+        analysis._add_event(
+            AnalysisRequested,
+            analysis_id=analysis.id,
+            user_id=user_id,
+            child_id=child_id,
+            situation=situation_text,
+            timestamp=analysis.created_at,
         )
         return analysis
     
     def start_processing(self) -> None:
         """Mark analysis as processing."""
         if self.status != AnalysisStatus.PENDING:
-            raise ValueError(f"Cannot start processing from status {self.status}")
+            raise ValueError(f"Cannot start processing from status {self.status.name}")
         self.status = AnalysisStatus.PROCESSING
     
     def complete(self, recommendation: AIRecommendation) -> None:
         """Complete analysis with AI recommendation."""
         if self.status != AnalysisStatus.PROCESSING:
-            raise ValueError(f"Cannot complete from status {self.status}")
+            raise ValueError(f"Cannot complete from status {self.status.name}")
         
         self.status = AnalysisStatus.COMPLETED
         self.recommendation = recommendation
         self.completed_at = datetime.utcnow()
         
-        self._events.append(
-            AnalysisCompleted(
-                analysis_id=self.id,
-                user_id=self.user_id,
-                timestamp=self.completed_at,
-                confidence_score=recommendation.confidence_score
-            )
+        self._add_event(
+            AnalysisCompleted,
+            analysis_id=self.id,
+            user_id=self.user_id,
+            timestamp=self.completed_at,
+            confidence_score=recommendation.confidence_score,
         )
     
     def fail(self, error_message: str) -> None:
@@ -109,6 +110,16 @@ class Analysis:
     
     def get_events(self) -> list:
         """Get and clear domain events."""
-        events = self._events.copy()
-        self._events.clear()
-        return events
\ No newline at end of file
+        events, self._events = self._events, None
+        if events is None:
+            return []
+        return [event_type(**fields) for event_type, fields in events]
+
+    def _add_event(self, event_type: type, **fields: object) -> None:
+        """Record a domain event; it is built when events are drained."""
+        pending = (event_type, fields)
+        events = self._events
+        if events is None:
+            self._events = [pending]
+        else:
+            events.append(pending)
\ No newline at end of file
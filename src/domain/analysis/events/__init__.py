@@ -1,11 +1,12 @@
 """Domain events for Analysis bounded context."""
 
-from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
+import attrs
 
-@dataclass(frozen=True)
+
+@attrs.frozen(eq=False)
 class AnalysisRequested:
     """Event raised when analysis is requested."""
     
@@ -16,7 +17,7 @@ class AnalysisRequested:
     timestamp: datetime
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class AnalysisCompleted:
     """Event raised when analysis is completed."""
     
@@ -1,7 +1,7 @@
 """Repository interfaces for Analysis bounded context."""
+from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
 from uuid import UUID
 
 from src.domain.analysis.aggregates import Analysis
@@ -16,7 +16,7 @@ class AnalysisRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_id(self, analysis_id: UUID) -> Optional[Analysis]:
+    async def get_by_id(self, analysis_id: UUID) -> Analysis | None:
         """Get analysis by ID."""
         pass
     
@@ -26,7 +26,7 @@ class AnalysisRepository(ABC):
         user_id: UUID,
         limit: int = 10,
         offset: int = 0
-    ) -> List[Analysis]:
+    ) -> list[Analysis]:
         """Get user's analyses with pagination."""
         pass
     
@@ -3,17 +3,21 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class SituationDescription:
     """Situation description value object."""
-    
+
     value: str
-    
-    def __post_init__(self) -> None:
-        if not self.value or len(self.value.strip()) < 10:
+
+    def __init__(self, value: str) -> None:
+        # Normalize once and validate the stored, stripped text.
+        value = value.strip() if value else ""
+        length = len(value)
+        if length < 10:
             raise ValueError("Situation description must be at least 10 characters")
-        if len(self.value) > 2000:
+        if length > 2000:
             raise ValueError("Situation description is too long (max 2000 characters)")
-    
+        object.__setattr__(self, "value", value)
+
     def __str__(self) -> str:
         return self.value
\ No newline at end of file
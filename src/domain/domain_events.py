@@ -1,75 +1,93 @@
 """Domain events."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
 from datetime import datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, ClassVar, Optional
 from uuid import UUID, uuid4
 
+import attrs
+
 from domain.value_objects import EmotionalTone, Gender
 
+# C-level callable: no Python frame or global lookups per default.
+_utcnow = partial(datetime.now, timezone.utc)
+
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class DomainEvent:
     """Base domain event."""
 
-    event_id: UUID = field(default_factory=uuid4)
-    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    aggregate_id: UUID = field(default=UUID(int=0))
+    event_id: UUID = attrs.field(factory=uuid4)
+    occurred_at: datetime = attrs.field(factory=_utcnow)
+    aggregate_id: UUID = UUID(int=0)
+
+    event_name: ClassVar[str] = "DomainEvent"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record the event name once per event class."""
+        super().__init_subclass__(**kwargs)
+        cls.event_name = cls.__name__
+
+    def __eq__(self, other: object) -> bool:
+        """Events are equal when they are the same event: same type and ID."""
+        if not isinstance(other, DomainEvent):
+            return NotImplemented
+        return other.__class__ is self.__class__ and other.event_id == self.event_id
 
-    @property
-    def event_name(self) -> str:
-        """Get event name."""
-        return self.__class__.__name__
+    def __hash__(self) -> int:
+        """Hash by event ID."""
+        return hash(self.event_id)
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class UserRegistered(DomainEvent):
     """User registered event."""
 
     telegram_id: int = 0
     username: Optional[str] = None
     first_name: str = ""
-    language_code: str = "en"
+    language_code: str = attrs.field(default="en", converter=sys.intern)
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class ChildAdded(DomainEvent):
     """Child added to user event."""
 
-    child_id: UUID = field(default_factory=uuid4)
+    child_id: UUID = attrs.field(factory=uuid4)
     child_name: str = ""
     birth_date: str = ""
     gender: Gender = Gender.OTHER
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class OnboardingCompleted(DomainEvent):
     """User completed onboarding event."""
 
     children_count: int = 0
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class SituationAnalyzed(DomainEvent):
     """Situation analyzed event."""
 
-    situation_id: UUID = field(default_factory=uuid4)
-    child_id: UUID = field(default_factory=uuid4)
+    situation_id: UUID = attrs.field(factory=uuid4)
+    child_id: UUID = attrs.field(factory=uuid4)
     situation_text: str = ""
     emotional_tone: Optional[EmotionalTone] = None
     confidence_score: float = 0.0
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class RecommendationViewed(DomainEvent):
     """Recommendation viewed by user event."""
 
-    recommendation_id: UUID = field(default_factory=uuid4)
-    situation_id: UUID = field(default_factory=uuid4)
+    recommendation_id: UUID = attrs.field(factory=uuid4)
+    situation_id: UUID = attrs.field(factory=uuid4)
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class UserDeactivated(DomainEvent):
     """User deactivated event."""
 
@@ -0,0 +1,22 @@
+"""Domain events (compatibility alias for :mod:`domain.domain_events`)."""
+from __future__ import annotations
+
+from domain.domain_events import (
+    ChildAdded,
+    DomainEvent,
+    OnboardingCompleted,
+    RecommendationViewed,
+    SituationAnalyzed,
+    UserDeactivated,
+    UserRegistered,
+)
+
+__all__ = [
+    "ChildAdded",
+    "DomainEvent",
+    "OnboardingCompleted",
+    "RecommendationViewed",
+    "SituationAnalyzed",
+    "UserDeactivated",
+    "UserRegistered",
+]
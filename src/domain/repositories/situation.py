@@ -22,6 +22,16 @@ class SituationRepository(Repository[Situation]):
         """Get user's situations."""
         ...
 
+    @abstractmethod
+    async def get_user_situations_with_child_names(
+        self,
+        user_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[tuple[Situation, Optional[str]]]:
+        """Get user's situations paired with the name of their child."""
+        ...
+
     @abstractmethod
     async def get_child_situations(
         self,
@@ -1,15 +1,16 @@
 """User aggregate root and related entities."""
+from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
 from uuid import UUID, uuid4
 
 from src.domain.user.value_objects import UserName, TelegramId
 from src.domain.user.events import UserRegistered, ChildAdded
 
 
-@dataclass
+@dataclass(slots=True)
 class Child:
     """Child entity."""
     
@@ -26,20 +27,22 @@ class Child:
             raise ValueError("Child age must be between 1 and 18")
         if self.gender not in ["male", "female", "not_specified"]:
             raise ValueError("Invalid gender value")
+        # Low-cardinality value shared by every child; keep one string object.
+        self.gender = sys.intern(self.gender)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User aggregate root."""
     
     id: UUID = field(default_factory=uuid4)
     telegram_id: TelegramId = field(default_factory=lambda: TelegramId(0))
     name: UserName = field(default_factory=lambda: UserName(""))
-    children: List[Child] = field(default_factory=list)
+    children: list[Child] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     is_active: bool = True
-    _events: List = field(default_factory=list, init=False, repr=False)
+    _events: list | None = field(default=None, init=False, repr=False)
     
     @classmethod
     def register(
@@ -51,18 +54,27 @@ class User:
         child_gender: str = "not_specified"
     ) -> "User":
         """Register a new user with initial child."""
+        now = datetime.utcnow()
         user = cls(
             telegram_id=TelegramId(telegram_id),
             name=UserName(name),
-            children=[Child(name=child_name, age=child_age, gender=child_gender)]
+            children=[
+                Child(
+                    name=child_name,
+                    age=child_age,
+                    gender=child_gender,
+                    created_at=now,
+                )
+            ],
+            created_at=now,
+            updated_at=now,
         )
-        user._events.append(
-            UserRegistered(
-                user_id=user.id,
-                telegram_id=telegram_id,
-                name=name,
-                timestamp=user.created_at
-            )
+        user._add_event(
+            UserRegistered,
+            user_id=user.id,
+            telegram_id=telegram_id,
+            name=name,
+            timestamp=user.created_at,
         )
         return user
     
@@ -71,28 +83,38 @@ class User:
         if len(self.children) >= 10:
             raise ValueError("Maximum number of children (10) reached")
         
-        child = Child(name=name, age=age, gender=gender)
+        now = datetime.utcnow()
+        child = Child(name=name, age=age, gender=gender, created_at=now)
         self.children.append(child)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         
-        self._events.append(
-            ChildAdded(
-                user_id=self.id,
-                child_id=child.id,
-                child_name=name,
-                child_age=age,
-                child_gender=gender,
-                timestamp=datetime.utcnow()
-            )
+        self._add_event(
+            ChildAdded,
+            user_id=self.id,
+            child_id=child.id,
+            child_name=name,
+            child_age=age,
+            child_gender=gender,
+            timestamp=now,
         )
         return child
     
-    def get_child_by_id(self, child_id: UUID) -> Optional[Child]:
+    def get_child_by_id(self, child_id: UUID) -> Child | None:
         """Get child by ID."""
         return next((c for c in self.children if c.id == child_id), None)
     
-    def get_events(self) -> List:
+    def get_events(self) -> list:
         """Get and clear domain events."""
-        events = self._events.copy()
-        self._events.clear()
-        return events
\ No newline at end of file
+        events, self._events = self._events, None
+        if events is None:
+            return []
+        return [event_type(**fields) for event_type, fields in events]
+
+    def _add_event(self, event_type: type, **fields: object) -> None:
+        """Record a domain event; it is built when events are drained."""
+        pending = (event_type, fields)
+        events = self._events
+        if events is None:
+            self._events = [pending]
+        else:
+            events.append(pending)
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Domain events for User bounded context."""
 
-from dataclasses import dataclass
+import sys
 from datetime import datetime
 from uuid import UUID
 
+import attrs
 
-@dataclass(frozen=True)
+
+@attrs.frozen(eq=False)
 class UserRegistered:
     """Event raised when a new user registers."""
     
@@ -15,7 +17,7 @@ class UserRegistered:
     timestamp: datetime
 
 
-@dataclass(frozen=True)
+@attrs.frozen(eq=False)
 class ChildAdded:
     """Event raised when a child is added to user's family."""
     
@@ -23,5 +25,5 @@ class ChildAdded:
     child_id: UUID
     child_name: str
     child_age: int
-    child_gender: str
+    child_gender: str = attrs.field(converter=sys.intern)
     timestamp: datetime
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Repository interfaces for User bounded context."""
+from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
 from uuid import UUID
 
 from src.domain.user.aggregates import User
@@ -16,12 +16,12 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+    async def get_by_id(self, user_id: UUID) -> User | None:
         """Get user by ID."""
         pass
     
     @abstractmethod
-    async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
+    async def get_by_telegram_id(self, telegram_id: int) -> User | None:
         """Get user by Telegram ID."""
         pass
     
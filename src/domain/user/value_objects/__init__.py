@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TelegramId:
     """Telegram user ID value object."""
     
@@ -17,7 +17,7 @@ class TelegramId:
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserName:
     """User name value object."""
     
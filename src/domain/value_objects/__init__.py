@@ -1,14 +1,15 @@
 """Domain value objects."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
 
-class Gender(Enum):
+class Gender(StrEnum):
     """Child gender enumeration."""
 
     MALE = "male"
@@ -16,7 +17,7 @@ class Gender(Enum):
     OTHER = "other"
 
 
-class EmotionalTone(Enum):
+class EmotionalTone(StrEnum):
     """Emotional tone of analysis."""
 
     POSITIVE = "positive"
@@ -25,12 +26,21 @@ class EmotionalTone(Enum):
     URGENT = "urgent"
 
 
-@dataclass(frozen=True)
+# Age group indexed by whole years; ChildAge validates years to 0..18.
+_AGE_GROUPS = (
+    ("toddler",) * 3 + ("preschooler",) * 3 + ("school_age",) * 6 + ("teenager",) * 7
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ChildAge:
     """Value object representing child's age."""
 
     years: int
     months: Optional[int] = 0
+    _formatted: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate age values."""
@@ -47,23 +57,21 @@ class ChildAge:
     @property
     def age_group(self) -> str:
         """Get age group classification."""
-        if self.years < 3:
-            return "toddler"
-        elif self.years < 6:
-            return "preschooler"
-        elif self.years < 12:
-            return "school_age"
-        else:
-            return "teenager"
+        return _AGE_GROUPS[self.years]
 
     def __str__(self) -> str:
-        """String representation of age."""
-        if self.months:
-            return f"{self.years} years {self.months} months"
-        return f"{self.years} years"
-
-
-@dataclass(frozen=True)
+        """String representation of age, formatted once per instance."""
+        formatted = self._formatted
+        if formatted is None:
+            if self.months:
+                formatted = f"{self.years} years {self.months} months"
+            else:
+                formatted = f"{self.years} years"
+            object.__setattr__(self, "_formatted", formatted)
+        return formatted
+
+
+@dataclass(frozen=True, slots=True)
 class TelegramUser:
     """Value object representing Telegram user data."""
 
@@ -81,14 +89,14 @@ class TelegramUser:
         return self.first_name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """Value object containing Claude's analysis."""
 
     hidden_meaning: str
-    immediate_actions: list[str]
-    long_term_recommendations: list[str]
-    what_not_to_do: list[str]
+    immediate_actions: tuple[str, ...]
+    long_term_recommendations: tuple[str, ...]
+    what_not_to_do: tuple[str, ...]
     emotional_tone: EmotionalTone
     confidence_score: float
     analyzed_at: datetime
@@ -99,7 +107,7 @@ class AnalysisResult:
             raise ValueError("Confidence score must be between 0 and 1")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Child:
     """Value object representing a child."""
 
@@ -112,15 +120,28 @@ class Child:
     @property
     def age(self) -> ChildAge:
         """Calculate current age."""
-        today = date.today()
-        years = today.year - self.birth_date.year
-        months = today.month - self.birth_date.month
-
-        if months < 0:
-            years -= 1
-            months += 12
-        elif months == 0 and today.day < self.birth_date.day:
-            years -= 1
-            months = 11
-
-        return ChildAge(years=years, months=months)
\ No newline at end of file
+        return _age_on(self.birth_date, date.today())
+
+    @property
+    def age_parts(self) -> tuple[int, int, str]:
+        """Current age as ``(years, months, age_group)``."""
+        return _age_parts_on(self.birth_date, date.today())
+
+
+@lru_cache(maxsize=4096)
+def _age_on(birth_date: date, today: date) -> ChildAge:
+    """Age on ``today``, shared by every child born on ``birth_date``."""
+    months = (
+        (today.year - birth_date.year) * 12
+        + today.month
+        - birth_date.month
+        - (today.day < birth_date.day)
+    )
+    return ChildAge(*divmod(months, 12))
+
+
+@lru_cache(maxsize=4096)
+def _age_parts_on(birth_date: date, today: date) -> tuple[int, int, str]:
+    """``_age_on`` unpacked for DTOs, cached under the same key."""
+    age = _age_on(birth_date, today)
+    return (age.years, age.months or 0, age.age_group)
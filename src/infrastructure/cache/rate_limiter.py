@@ -1,77 +1,128 @@
 """Rate limiter implementation using Redis."""
 
-from datetime import datetime, timedelta
+import time
+from functools import lru_cache
 from uuid import UUID
 
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
 from src.config import settings
 
+from .redis import get_redis
+
+# GCRA (generic cell rate algorithm) over two envelopes, daily and hourly,
+# kept as theoretical arrival times (ms) in one hash per user.
+# KEYS = {user hash}; ARGV = {now_ms, cost, commit, day_burst,
+# day_interval_ms, hour_burst, hour_interval_ms}. A request is admitted only
+# if both envelopes admit it; with commit=1 the new arrival times are stored.
+# Returns {allowed, daily_remaining, hourly_remaining}.
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local stored = redis.call('HMGET', KEYS[1], 'day', 'hour')
+local allowed = 1
+local tats = {}
+local new_tats = {}
+for i = 1, 2 do
+    local burst = tonumber(ARGV[2 + 2 * i])
+    local interval = tonumber(ARGV[3 + 2 * i])
+    tats[i] = math.max(tonumber(stored[i]) or now, now)
+    new_tats[i] = tats[i] + interval * cost
+    if new_tats[i] - burst * interval > now then allowed = 0 end
+end
+local remaining = {}
+local ttl = 0
+for i = 1, 2 do
+    local burst = tonumber(ARGV[2 + 2 * i])
+    local interval = tonumber(ARGV[3 + 2 * i])
+    local tat = tats[i]
+    if allowed == 1 then tat = new_tats[i] end
+    remaining[i] = math.max(math.floor(burst - (tat - now) / interval), 0)
+    ttl = math.max(ttl, tat - now)
+end
+if allowed == 1 and ARGV[3] == '1' and cost > 0 then
+    redis.call('HSET', KEYS[1], 'day', new_tats[1], 'hour', new_tats[2])
+    redis.call('PEXPIRE', KEYS[1], math.ceil(ttl))
+end
+return {allowed, remaining[1], remaining[2]}
+"""
+
+DAY_MS = 24 * 60 * 60 * 1000
+HOUR_MS = 60 * 60 * 1000
+
+# Per-user hash key is KEY_PREFIX + user_id.hex (no dashes).
+KEY_PREFIX = "rl:"
+
+
+@lru_cache(maxsize=1)
+def _gcra_script(redis: Redis) -> AsyncScript:
+    """Register the GCRA script once per client.
+
+    The script object calls EVALSHA with its precomputed SHA and, on
+    NOSCRIPT (server restart or SCRIPT FLUSH), loads the source and retries.
+    """
+    return redis.register_script(GCRA_SCRIPT)
+
 
 class RedisRateLimiter:
     """Redis-based rate limiter."""
-    
+
     def __init__(self) -> None:
-        self._redis = Redis.from_url(settings.redis_url, decode_responses=True)
+        self._redis = get_redis()
         self._daily_limit = settings.max_requests_per_user_per_day
         self._hourly_limit = settings.max_requests_per_user_per_hour
-    
+        # Burst and emission interval per envelope, passed to every call.
+        # A limit of 0 means a burst of 0, which denies every request; the
+        # interval stays at least one period so the script never divides by 0.
+        self._envelopes = (
+            self._daily_limit,
+            DAY_MS // max(self._daily_limit, 1),
+            self._hourly_limit,
+            HOUR_MS // max(self._hourly_limit, 1),
+        )
+        self._gcra_script = _gcra_script(self._redis)
+
+    async def _gcra(self, user_id: UUID, cost: int, commit: bool) -> tuple[bool, int, int]:
+        """Run the GCRA script for ``user_id``."""
+        allowed, daily_remaining, hourly_remaining = await self._gcra_script(
+            keys=[f"{KEY_PREFIX}{user_id.hex}"],
+            args=[time.time_ns() // 1_000_000, cost, int(commit), *self._envelopes],
+        )
+        return bool(allowed), int(daily_remaining), int(hourly_remaining)
+
+    async def check_and_increment(self, user_id: UUID) -> tuple[bool, int, int]:
+        """Admit and count one request in a single round-trip.
+
+        Returns ``(allowed, daily_remaining, hourly_remaining)``. Replaces the
+        ``check_limit`` + ``increment_usage`` pair, which needs two
+        round-trips and lets concurrent requests slip past the limit.
+        """
+        return await self._gcra(user_id, cost=1, commit=True)
+
+    async def reserve(self, user_id: UUID) -> bool:
+        """Consume one request from the user's quota if it is available."""
+        allowed, _, _ = await self.check_and_increment(user_id)
+        return allowed
+
     async def check_limit(self, user_id: UUID) -> bool:
         """Check if user has reached rate limit."""
-        user_id_str = str(user_id)
-        now = datetime.utcnow()
-        
-        # Check daily limit
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        daily_count = await self._redis.get(daily_key)
-        if daily_count and int(daily_count) >= self._daily_limit:
-            return False
-        
-        # Check hourly limit
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        hourly_count = await self._redis.get(hourly_key)
-        if hourly_count and int(hourly_count) >= self._hourly_limit:
-            return False
-        
-        return True
-    
+        allowed, _, _ = await self._gcra(user_id, cost=1, commit=False)
+        return allowed
+
     async def increment_usage(self, user_id: UUID) -> None:
         """Increment usage counter."""
-        user_id_str = str(user_id)
-        now = datetime.utcnow()
-        
-        # Increment daily counter
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        await self._redis.incr(daily_key)
-        await self._redis.expire(daily_key, timedelta(days=1))
-        
-        # Increment hourly counter
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        await self._redis.incr(hourly_key)
-        await self._redis.expire(hourly_key, timedelta(hours=1))
-    
+        await self._gcra(user_id, cost=1, commit=True)
+
     async def get_remaining_requests(self, user_id: UUID) -> dict:
         """Get remaining requests for user."""
-        user_id_str = str(user_id)
-        now = datetime.utcnow()
-        
-        # Get daily usage
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        daily_count = await self._redis.get(daily_key)
-        daily_used = int(daily_count) if daily_count else 0
-        
-        # Get hourly usage
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        hourly_count = await self._redis.get(hourly_key)
-        hourly_used = int(hourly_count) if hourly_count else 0
-        
+        _, daily_remaining, hourly_remaining = await self._gcra(
+            user_id, cost=0, commit=False
+        )
+
         return {
-            "daily_remaining": max(0, self._daily_limit - daily_used),
-            "hourly_remaining": max(0, self._hourly_limit - hourly_used),
+            "daily_remaining": daily_remaining,
+            "hourly_remaining": hourly_remaining,
             "daily_limit": self._daily_limit,
             "hourly_limit": self._hourly_limit
-        }
-    
-    async def close(self) -> None:
-        """Close Redis connection."""
-        await self._redis.close()
\ No newline at end of file
+        }
\ No newline at end of file
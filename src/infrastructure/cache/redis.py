@@ -0,0 +1,26 @@
+"""Shared Redis client."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from config import settings
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Get the process-wide Redis client and its connection pool."""
+    return Redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        max_connections=settings.redis_pool_size,
+        health_check_interval=30,
+    )
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client on application shutdown."""
+    if get_redis.cache_info().currsize:
+        await get_redis().close()
+        get_redis.cache_clear()
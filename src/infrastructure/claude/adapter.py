@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import random
+import time
+from functools import lru_cache
 from typing import Optional
 
 import anthropic
@@ -10,77 +14,26 @@ import structlog
 from anthropic import AsyncAnthropic
 
 from config import settings
+from infrastructure.external_services.anthropic_client import (
+    close_cached_client,
+    create_anthropic_client,
+)
 
 logger = structlog.get_logger()
 
 
-class ClaudeAdapter:
-    """Claude AI adapter for situation analysis."""
-
-    def __init__(self) -> None:
-        """Initialize Claude adapter."""
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-        self.model = settings.claude_model
-        self.max_tokens = settings.claude_max_tokens
-        self.temperature = settings.claude_temperature
-        self.retry_attempts = settings.claude_retry_attempts
-
-    async def analyze_situation(
-        self,
-        situation: str,
-        child_age: str,
-        child_gender: str,
-        context: Optional[str] = None,
-    ) -> dict:
-        """Analyze situation using Claude."""
-        prompt = self._build_prompt(situation, child_age, child_gender, context)
-
-        for attempt in range(self.retry_attempts):
-            try:
-                response = await asyncio.wait_for(
-                    self._call_claude(prompt),
-                    timeout=settings.claude_timeout,
-                )
-                return self._parse_response(response)
-            except asyncio.TimeoutError:
-                logger.warning(
-                    "Claude request timeout",
-                    attempt=attempt + 1,
-                    max_attempts=self.retry_attempts,
-                )
-                if attempt == self.retry_attempts - 1:
-                    raise
-            except Exception as e:
-                logger.error(
-                    "Claude request failed",
-                    error=str(e),
-                    attempt=attempt + 1,
-                    max_attempts=self.retry_attempts,
-                )
-                if attempt == self.retry_attempts - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-
-    def _build_prompt(
-        self,
-        situation: str,
-        child_age: str,
-        child_gender: str,
-        context: Optional[str] = None,
-    ) -> str:
-        """Build analysis prompt."""
-        gender_pronoun = "он" if child_gender == "male" else "она"
-        
-        prompt = f"""Ты опытный детский психолог и специалист по развитию детей. Проанализируй следующую ситуацию с ребенком.
+# Gender is fixed per template, so it is substituted once at import and
+# only the per-request values are formatted in _build_prompt.
+_PROMPT_TEMPLATE = """Ты опытный детский психолог и специалист по развитию детей. Проанализируй следующую ситуацию с ребенком.
 
 Информация о ребенке:
 - Возраст: {child_age}
-- Пол: {"мальчик" if child_gender == "male" else "девочка"}
+- Пол: {child_gender}
 
 Ситуация:
 {situation}
 
-{f"Дополнительный контекст: {context}" if context else ""}
+{context_block}
 
 Проанализируй эту ситуацию и предоставь ответ в формате JSON со следующей структурой:
 
@@ -117,7 +70,188 @@ class ClaudeAdapter:
 
 Отвечай ТОЛЬКО валидным JSON без дополнительного текста."""
 
-        return prompt
+_PROMPT_MALE = _PROMPT_TEMPLATE.replace("{child_gender}", "мальчик").replace(
+    "{gender_pronoun}", "он"
+)
+_PROMPT_FEMALE = _PROMPT_TEMPLATE.replace("{child_gender}", "девочка").replace(
+    "{gender_pronoun}", "она"
+)
+
+_REQUIRED_FIELDS = frozenset({
+    "hidden_meaning",
+    "immediate_actions",
+    "long_term_recommendations",
+    "what_not_to_do",
+    "emotional_tone",
+})
+_VALID_TONES = frozenset({"positive", "neutral", "concerning", "urgent"})
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Analyses in flight, keyed by a digest of their prompt.
+_in_flight: dict[bytes, asyncio.Future[dict]] = {}
+
+
+@lru_cache
+def get_anthropic_client() -> AsyncAnthropic:
+    """Get the process-wide Anthropic client and its keep-alive pool."""
+    # ClaudeAdapter's backoff loop and circuit breaker own retries; SDK
+    # retries would multiply attempts and hide failures from the breaker
+    return create_anthropic_client(settings, max_retries=0)
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic client on application shutdown."""
+    await close_cached_client(get_anthropic_client)
+
+
+class CircuitOpenError(Exception):
+    """Raised when Claude calls are short-circuited after repeated failures."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for the Claude API.
+
+    Opens after ``failure_threshold`` transient failures in a row. Once
+    ``recovery_time`` seconds have passed, one trial call is let through per
+    window (half-open); a success closes the circuit again.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_time: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Return whether a call may be attempted now."""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.recovery_time:
+            return False
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a transient failure and open the circuit at the threshold."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+@lru_cache
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide Claude circuit breaker."""
+    return CircuitBreaker(
+        failure_threshold=settings.claude_circuit_failure_threshold,
+        recovery_time=settings.claude_circuit_recovery_time,
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Timeouts, connection errors, 429 and 5xx are worth retrying."""
+    if isinstance(error, (asyncio.TimeoutError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and (
+        error.status_code == 429 or error.status_code >= 500
+    )
+
+
+class ClaudeAdapter:
+    """Claude AI adapter for situation analysis."""
+
+    def __init__(self) -> None:
+        """Initialize Claude adapter."""
+        self.client = get_anthropic_client()
+        self.model = settings.claude_model
+        self.max_tokens = settings.claude_max_tokens
+        self.temperature = settings.claude_temperature
+        self.retry_attempts = settings.claude_retry_attempts
+
+    async def analyze_situation(
+        self,
+        situation: str,
+        child_age: str,
+        child_gender: str,
+        context: Optional[str] = None,
+    ) -> dict:
+        """Analyze situation using Claude.
+
+        Identical prompts already in flight share one upstream call.
+        """
+        prompt = self._build_prompt(situation, child_age, child_gender, context)
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+        task = _in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._analyze(prompt))
+            _in_flight[key] = task
+            task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+        # Shielded so one caller giving up does not cancel the others
+        return dict(await asyncio.shield(task))
+
+    async def _analyze(self, prompt: str) -> dict:
+        """Run the prompt against Claude with retries."""
+        breaker = get_circuit_breaker()
+        # One deadline for all attempts, so a caller waits at most
+        # claude_total_deadline rather than retry_attempts * claude_timeout.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.claude_total_deadline
+
+        for attempt in range(self.retry_attempts):
+            if not breaker.allow():
+                raise CircuitOpenError("Claude API circuit is open")
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            try:
+                response = await asyncio.wait_for(
+                    self._call_claude(prompt),
+                    timeout=min(settings.claude_timeout, remaining),
+                )
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
+                breaker.record_failure()
+                logger.warning(
+                    "Claude request failed",
+                    error=str(e) or type(e).__name__,
+                    attempt=attempt + 1,
+                    max_attempts=self.retry_attempts,
+                )
+                if attempt == self.retry_attempts - 1:
+                    raise
+                # Full jitter keeps workers from retrying in lockstep
+                delay = min(settings.claude_max_backoff, random.uniform(0, 2 ** attempt))
+                if loop.time() + delay >= deadline:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return self._parse_response(response)
+
+    def _build_prompt(
+        self,
+        situation: str,
+        child_age: str,
+        child_gender: str,
+        context: Optional[str] = None,
+    ) -> str:
+        """Build analysis prompt."""
+        template = _PROMPT_MALE if child_gender == "male" else _PROMPT_FEMALE
+        context_block = f"Дополнительный контекст: {context}" if context else ""
+        return template.format(
+            situation=situation,
+            child_age=child_age,
+            context_block=context_block,
+        )
 
     async def _call_claude(self, prompt: str) -> str:
         """Call Claude API."""
@@ -138,36 +272,24 @@ class ClaudeAdapter:
     def _parse_response(self, response: str) -> dict:
         """Parse Claude response."""
         try:
-            # Try to extract JSON from response
+            # Decode the first JSON object in place; prose after it is ignored
             start_idx = response.find("{")
-            end_idx = response.rfind("}") + 1
             
-            if start_idx == -1 or end_idx == 0:
+            if start_idx == -1:
                 raise ValueError("No JSON found in response")
                 
-            json_str = response[start_idx:end_idx]
-            result = json.loads(json_str)
+            result, _ = _JSON_DECODER.raw_decode(response, start_idx)
             
             # Validate required fields
-            required_fields = [
-                "hidden_meaning",
-                "immediate_actions",
-                "long_term_recommendations",
-                "what_not_to_do",
-                "emotional_tone",
-            ]
-            
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"Missing required field: {field}")
+            if not _REQUIRED_FIELDS <= result.keys():
+                missing = ", ".join(sorted(_REQUIRED_FIELDS - result.keys()))
+                raise ValueError(f"Missing required fields: {missing}")
             
             # Set defaults if missing
-            if "confidence_score" not in result:
-                result["confidence_score"] = 0.8
+            result.setdefault("confidence_score", 0.8)
                 
             # Validate emotional_tone
-            valid_tones = ["positive", "neutral", "concerning", "urgent"]
-            if result["emotional_tone"] not in valid_tones:
+            if result["emotional_tone"] not in _VALID_TONES:
                 result["emotional_tone"] = "neutral"
                 
             return result
@@ -1,6 +1,7 @@
 """Application settings."""
 
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Any, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,7 +13,8 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=False
+        case_sensitive=False,
+        frozen=True,
     )
     
     # Environment
@@ -30,6 +32,9 @@ class Settings(BaseSettings):
         default="claude-3-sonnet-20240229",
         alias="CLAUDE_MODEL"
     )
+    claude_timeout: int = Field(default=30, alias="CLAUDE_TIMEOUT")
+    claude_max_connections: int = Field(default=20, alias="CLAUDE_MAX_CONNECTIONS")
+    claude_max_keepalive: int = Field(default=10, alias="CLAUDE_MAX_KEEPALIVE")
     
     # PostgreSQL
     postgres_host: str = Field(default="localhost", alias="POSTGRES_HOST")
@@ -37,12 +42,17 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="family_emotions", alias="POSTGRES_DB")
     postgres_user: str = Field(default="emotions_user", alias="POSTGRES_USER")
     postgres_password: str = Field(alias="POSTGRES_PASSWORD")
+    pg_pool_size: int = Field(default=20, alias="PG_POOL_SIZE")
+    pg_max_overflow: int = Field(default=10, alias="PG_MAX_OVERFLOW")
+    pg_pool_recycle: int = Field(default=1800, alias="PG_POOL_RECYCLE")
+    pg_statement_cache_size: int = Field(default=1024, alias="PG_STATEMENT_CACHE_SIZE")
     
     # Redis
     redis_host: str = Field(default="localhost", alias="REDIS_HOST")
     redis_port: int = Field(default=6379, alias="REDIS_PORT")
     redis_db: int = Field(default=0, alias="REDIS_DB")
     redis_password: Optional[str] = Field(default=None, alias="REDIS_PASSWORD")
+    user_cache_ttl: int = Field(default=120, alias="USER_CACHE_TTL")
     
     # Security
     secret_key: str = Field(alias="SECRET_KEY")
@@ -57,7 +67,7 @@ class Settings(BaseSettings):
         alias="MAX_REQUESTS_PER_USER_PER_HOUR"
     )
     
-    @property
+    @cached_property
     def postgres_url(self) -> str:
         """Build PostgreSQL connection URL."""
         return (
@@ -65,7 +75,7 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
     
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Build Redis connection URL."""
         password_part = f":{self.redis_password}@" if self.redis_password else ""
@@ -88,5 +98,14 @@ class Settings(BaseSettings):
         return v.upper()
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get cached settings instance."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``settings`` on first access instead of at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,21 @@
+"""Callbacks deferred until a session's transaction has committed."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_AFTER_COMMIT = "after_commit"
+
+
+def call_after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[Any]]
+) -> None:
+    """Queue ``callback`` to run once ``session`` has committed."""
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """Run and clear the callbacks queued on ``session``."""
+    for callback in session.info.pop(_AFTER_COMMIT, ()):
+        await callback()
@@ -0,0 +1,30 @@
+"""Bring the database schema up to date."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+from infrastructure.database.session import db_manager
+
+# src/infrastructure/database -> repository root
+ALEMBIC_DIR = Path(__file__).resolve().parents[3] / "alembic"
+
+
+def upgrade_to_head() -> None:
+    """Apply pending Alembic migrations."""
+    # No ini file: env.py would run logging.fileConfig on it and disable the
+    # bot's loggers. env.py sets the database URL itself.
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    command.upgrade(config, "head")
+
+
+async def init_schema() -> None:
+    """Create missing tables, then apply pending migrations."""
+    await db_manager.create_all()
+    # env.py drives its async engine with asyncio.run, which cannot nest
+    # inside an already running loop.
+    await asyncio.to_thread(upgrade_to_head)
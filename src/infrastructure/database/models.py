@@ -5,10 +5,12 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, Float
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Index, String, Text, desc, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from domain.value_objects import Gender
+
 
 class Base(DeclarativeBase):
     """Base model."""
@@ -29,15 +31,22 @@ class UserModel(Base):
     language_code: Mapped[str] = mapped_column(String(10), default="ru")
     onboarding_completed: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        index=True,
+    )
 
     # Relationships
     children: Mapped[list["ChildModel"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
     situations: Mapped[list["SituationModel"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
@@ -52,13 +61,15 @@ class ChildModel(Base):
     )
     name: Mapped[str] = mapped_column(String(255))
     birth_date: Mapped[datetime] = mapped_column(DateTime)
-    gender: Mapped[str] = mapped_column(String(20))
+    gender: Mapped[Gender] = mapped_column(
+        Enum(Gender, name="gender", values_callable=lambda enum: [m.value for m in enum])
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Relationships
     user: Mapped["UserModel"] = relationship(back_populates="children")
     situations: Mapped[list["SituationModel"]] = relationship(
-        back_populates="child", cascade="all, delete-orphan"
+        back_populates="child", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
@@ -66,30 +77,35 @@ class SituationModel(Base):
     """Situation database model."""
 
     __tablename__ = "situations"
+    # Situation lists filter by user or child and page newest first; these
+    # serve them in index order and cover the plain user_id/child_id lookups.
+    __table_args__ = (
+        Index("ix_situations_user_id_created_at", "user_id", desc("created_at")),
+        Index("ix_situations_child_id_created_at", "child_id", desc("created_at")),
+    )
 
     id: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True)
     user_id: Mapped[UUID] = mapped_column(
-        PostgresUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True
+        PostgresUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")
     )
     child_id: Mapped[UUID] = mapped_column(
-        PostgresUUID(as_uuid=True), ForeignKey("children.id", ondelete="CASCADE"), index=True
+        PostgresUUID(as_uuid=True), ForeignKey("children.id", ondelete="CASCADE")
     )
     description: Mapped[str] = mapped_column(Text)
     context: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     analyzed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
 
-    # Analysis result fields
-    hidden_meaning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    immediate_actions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    long_term_recommendations: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True
+    # Analysis result as one document: hidden_meaning, immediate_actions,
+    # long_term_recommendations, what_not_to_do, emotional_tone,
+    # confidence_score. JSONB on PostgreSQL, plain JSON elsewhere (tests).
+    analysis: Mapped[Optional[dict]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True
     )
-    what_not_to_do: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    emotional_tone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    confidence_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Relationships
     user: Mapped["UserModel"] = relationship(back_populates="situations")
@@ -1,108 +1,191 @@
 """Database repository implementations."""
 from __future__ import annotations
 
-import json
 from datetime import date, datetime
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy import Insert, Row, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from config import settings
 from domain.aggregates.situation import Situation
 from domain.aggregates.user import User
 from domain.repositories.situation import SituationRepository
 from domain.repositories.user import UserRepository
 from domain.value_objects import AnalysisResult, Child, EmotionalTone, Gender, TelegramUser
+from infrastructure.database.after_commit import call_after_commit
 from infrastructure.database.models import ChildModel, SituationModel, UserModel
 
+# Situation reads build the aggregate straight from rows, skipping ORM
+# instances and identity-map bookkeeping.
+_SITUATION_COLUMNS = tuple(SituationModel.__table__.c)
+
+# Children are loaded eagerly; any other relationship access raises rather
+# than issuing a hidden lazy-load query.
+_LOAD_WITH_CHILDREN = (
+    selectinload(UserModel.children).raiseload("*"),
+    raiseload("*"),
+)
+
+# Cached User aggregates are stored under USER_CACHE_PREFIX + telegram_id.
+USER_CACHE_PREFIX = "u:tg:"
+
+# Saves upsert with INSERT ... ON CONFLICT. PostgreSQL is the production
+# database; the SQLite test engine gets its own construct.
+_UPSERT_INSERTS = {"sqlite": sqlite_insert}
+
+
+def _upsert(session: AsyncSession, model: type) -> Insert:
+    """Build an ``INSERT`` for ``model`` that accepts ``on_conflict_do_update``."""
+    return _UPSERT_INSERTS.get(session.bind.dialect.name, pg_insert)(model)
+
+
+def _user_to_json(user: User) -> bytes:
+    """Serialize a user aggregate for the lookup cache."""
+    telegram_user = user.telegram_user
+    return orjson.dumps(
+        {
+            "id": user.id,
+            "telegram_id": telegram_user.telegram_id,
+            "username": telegram_user.username,
+            "first_name": telegram_user.first_name,
+            "last_name": telegram_user.last_name,
+            "language_code": telegram_user.language_code,
+            "children": [
+                [child.id, child.name, child.birth_date, child.gender, child.notes]
+                for child in user.children
+            ],
+            "onboarding_completed": user.onboarding_completed,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+            "is_active": user.is_active,
+        }
+    )
+
+
+def _user_from_json(data: bytes) -> User:
+    """Rebuild a user aggregate from its cached form."""
+    cached = orjson.loads(data)
+    return User(
+        id=UUID(cached["id"]),
+        telegram_user=TelegramUser(
+            telegram_id=cached["telegram_id"],
+            username=cached["username"],
+            first_name=cached["first_name"],
+            last_name=cached["last_name"],
+            language_code=cached["language_code"],
+        ),
+        children=[
+            Child(
+                id=UUID(child_id),
+                name=name,
+                birth_date=date.fromisoformat(birth_date),
+                gender=Gender(gender),
+                notes=notes,
+            )
+            for child_id, name, birth_date, gender, notes in cached["children"]
+        ],
+        onboarding_completed=cached["onboarding_completed"],
+        created_at=datetime.fromisoformat(cached["created_at"]),
+        updated_at=datetime.fromisoformat(cached["updated_at"]),
+        is_active=cached["is_active"],
+    )
+
+
+def _analysis_to_json(result: AnalysisResult) -> dict:
+    """Convert an analysis result to the ``situations.analysis`` document."""
+    return {
+        "hidden_meaning": result.hidden_meaning,
+        "immediate_actions": result.immediate_actions,
+        "long_term_recommendations": result.long_term_recommendations,
+        "what_not_to_do": result.what_not_to_do,
+        "emotional_tone": result.emotional_tone,
+        "confidence_score": result.confidence_score,
+    }
+
 
 class SQLAlchemyUserRepository(UserRepository):
     """SQLAlchemy user repository implementation."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository."""
+    def __init__(self, session: AsyncSession, cache: Optional[Redis] = None) -> None:
+        """Initialize repository; ``cache`` enables Telegram ID lookup caching."""
         self.session = session
+        self.cache = cache
 
     async def save(self, user: User) -> None:
         """Save user aggregate."""
-        # Check if user exists with eager loading of children
-        stmt = select(UserModel).options(selectinload(UserModel.children)).where(UserModel.id == user.id)
-        result = await self.session.execute(stmt)
-        db_user = result.scalar_one_or_none()
+        telegram_user = user.telegram_user
+        user_row = {
+            "username": telegram_user.username,
+            "first_name": telegram_user.first_name,
+            "last_name": telegram_user.last_name,
+            "language_code": telegram_user.language_code,
+            "onboarding_completed": user.onboarding_completed,
+            "is_active": user.is_active,
+            "updated_at": user.updated_at,
+        }
+        stmt = _upsert(self.session, UserModel).values(
+            id=user.id,
+            telegram_id=telegram_user.telegram_id,
+            created_at=user.created_at,
+            **user_row,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(index_elements=[UserModel.id], set_=user_row)
+        )
 
-        if db_user:
-            # Update existing
-            db_user.username = user.telegram_user.username
-            db_user.first_name = user.telegram_user.first_name
-            db_user.last_name = user.telegram_user.last_name
-            db_user.language_code = user.telegram_user.language_code
-            db_user.onboarding_completed = user.onboarding_completed
-            db_user.is_active = user.is_active
-            db_user.updated_at = user.updated_at
-
-            # Update children - children are already loaded via selectinload
-            existing_children = list(db_user.children)  # Convert to list to avoid lazy loading
-            existing_child_ids = {child.id for child in existing_children}
-            current_child_ids = {child.id for child in user.children}
-
-            # Remove deleted children
-            for child in existing_children:
-                if child.id not in current_child_ids:
-                    await self.session.delete(child)
-
-            # Add or update children
-            for child in user.children:
-                if child.id not in existing_child_ids:
-                    db_child = ChildModel(
-                        id=child.id,
-                        user_id=user.id,
-                        name=child.name,
-                        birth_date=child.birth_date,
-                        gender=child.gender.value,
-                        notes=child.notes,
-                    )
-                    self.session.add(db_child)
-        else:
-            # Create new
-            db_user = UserModel(
-                id=user.id,
-                telegram_id=user.telegram_user.telegram_id,
-                username=user.telegram_user.username,
-                first_name=user.telegram_user.first_name,
-                last_name=user.telegram_user.last_name,
-                language_code=user.telegram_user.language_code,
-                onboarding_completed=user.onboarding_completed,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
+        # Remove deleted children
+        child_ids = [child.id for child in user.children]
+        await self.session.execute(
+            delete(ChildModel).where(
+                ChildModel.user_id == user.id, ChildModel.id.notin_(child_ids)
             )
+        )
 
-            # Add children
-            for child in user.children:
-                db_child = ChildModel(
-                    id=child.id,
-                    user_id=user.id,
-                    name=child.name,
-                    birth_date=child.birth_date,
-                    gender=child.gender.value,
-                    notes=child.notes,
+        # Add or update children
+        if user.children:
+            stmt = _upsert(self.session, ChildModel).values(
+                [
+                    {
+                        "id": child.id,
+                        "user_id": user.id,
+                        "name": child.name,
+                        "birth_date": child.birth_date,
+                        "gender": child.gender,
+                        "notes": child.notes,
+                    }
+                    for child in user.children
+                ]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[ChildModel.id],
+                    set_={
+                        "name": stmt.excluded.name,
+                        "birth_date": stmt.excluded.birth_date,
+                        "gender": stmt.excluded.gender,
+                        "notes": stmt.excluded.notes,
+                    },
                 )
-                db_user.children.append(db_child)
+            )
 
-            self.session.add(db_user)
+        self._invalidate(telegram_user.telegram_id)
 
-        # Process domain events (could publish to event bus here)
-        for event in user.collect_events():
-            # Log or publish event
-            pass
+        # No event bus yet; drop the events recorded since the last save
+        user.clear_events()
 
     async def get(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
         stmt = (
             select(UserModel)
-            .options(selectinload(UserModel.children))
+            .options(*_LOAD_WITH_CHILDREN)
             .where(UserModel.id == user_id)
         )
         result = await self.session.execute(stmt)
@@ -115,9 +198,15 @@ class SQLAlchemyUserRepository(UserRepository):
 
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Get user by Telegram ID."""
+        cache_key = f"{USER_CACHE_PREFIX}{telegram_id}"
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached:
+                return _user_from_json(cached)
+
         stmt = (
             select(UserModel)
-            .options(selectinload(UserModel.children))
+            .options(*_LOAD_WITH_CHILDREN)
             .where(UserModel.telegram_id == telegram_id)
         )
         result = await self.session.execute(stmt)
@@ -126,25 +215,42 @@ class SQLAlchemyUserRepository(UserRepository):
         if not db_user:
             return None
 
-        return self._to_domain(db_user)
+        user = self._to_domain(db_user)
+        if self.cache is not None:
+            await self.cache.set(
+                cache_key, _user_to_json(user), ex=settings.user_cache_ttl
+            )
+        return user
 
     async def exists_by_telegram_id(self, telegram_id: int) -> bool:
         """Check if user exists by Telegram ID."""
-        stmt = select(func.count()).select_from(UserModel).where(
-            UserModel.telegram_id == telegram_id
-        )
+        stmt = select(exists().where(UserModel.telegram_id == telegram_id))
         result = await self.session.execute(stmt)
-        count = result.scalar()
-        return count > 0
+        return bool(result.scalar())
 
     async def delete(self, user_id: UUID) -> None:
         """Delete user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(stmt)
-        db_user = result.scalar_one_or_none()
-
-        if db_user:
-            await self.session.delete(db_user)
+        # Children and situations go with the user via ON DELETE CASCADE
+        result = await self.session.execute(
+            delete(UserModel)
+            .where(UserModel.id == user_id)
+            .returning(UserModel.telegram_id)
+        )
+        telegram_id = result.scalar_one_or_none()
+        if telegram_id is not None:
+            self._invalidate(telegram_id)
+
+    def _invalidate(self, telegram_id: int) -> None:
+        """Drop the cached user once the current transaction commits.
+
+        Deleting earlier would let a concurrent lookup re-cache the
+        still-committed old row.
+        """
+        if self.cache is not None:
+            call_after_commit(
+                self.session,
+                partial(self.cache.delete, f"{USER_CACHE_PREFIX}{telegram_id}"),
+            )
 
     def _to_domain(self, db_user: UserModel) -> User:
         """Convert database model to domain aggregate."""
@@ -156,29 +262,28 @@ class SQLAlchemyUserRepository(UserRepository):
             language_code=db_user.language_code,
         )
 
-        user = User(
-            id=db_user.id,
-            telegram_user=telegram_user,
-            onboarding_completed=db_user.onboarding_completed,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at,
-            is_active=db_user.is_active,
-        )
-
-        # Add children
-        for db_child in db_user.children:
-            child = Child(
+        children = [
+            Child(
                 id=db_child.id,
                 name=db_child.name,
                 birth_date=db_child.birth_date.date()
                 if isinstance(db_child.birth_date, datetime)
                 else db_child.birth_date,
-                gender=Gender(db_child.gender),
+                gender=db_child.gender,
                 notes=db_child.notes,
             )
-            user.children.append(child)
+            for db_child in db_user.children
+        ]
 
-        return user
+        return User(
+            id=db_user.id,
+            telegram_user=telegram_user,
+            children=children,
+            onboarding_completed=db_user.onboarding_completed,
+            created_at=db_user.created_at,
+            updated_at=db_user.updated_at,
+            is_active=db_user.is_active,
+        )
 
 
 class SQLAlchemySituationRepository(SituationRepository):
@@ -190,105 +295,86 @@ class SQLAlchemySituationRepository(SituationRepository):
 
     async def save(self, situation: Situation) -> None:
         """Save situation aggregate."""
-        # Check if situation exists
-        stmt = select(SituationModel).where(SituationModel.id == situation.id)
-        result = await self.session.execute(stmt)
-        db_situation = result.scalar_one_or_none()
-
-        if db_situation:
-            # Update existing
-            db_situation.description = situation.description
-            db_situation.context = situation.context
-            db_situation.analyzed_at = situation.analyzed_at
-
-            if situation.analysis_result:
-                db_situation.hidden_meaning = situation.analysis_result.hidden_meaning
-                db_situation.immediate_actions = json.dumps(
-                    situation.analysis_result.immediate_actions
-                )
-                db_situation.long_term_recommendations = json.dumps(
-                    situation.analysis_result.long_term_recommendations
-                )
-                db_situation.what_not_to_do = json.dumps(
-                    situation.analysis_result.what_not_to_do
-                )
-                db_situation.emotional_tone = situation.analysis_result.emotional_tone.value
-                db_situation.confidence_score = situation.analysis_result.confidence_score
-        else:
-            # Create new
-            db_situation = SituationModel(
-                id=situation.id,
-                user_id=situation.user_id,
-                child_id=situation.child_id,
-                description=situation.description,
-                context=situation.context,
-                created_at=situation.created_at,
-                analyzed_at=situation.analyzed_at,
+        situation_row = {
+            "description": situation.description,
+            "context": situation.context,
+            "analyzed_at": situation.analyzed_at,
+        }
+        if situation.analysis_result:
+            situation_row["analysis"] = _analysis_to_json(situation.analysis_result)
+
+        stmt = _upsert(self.session, SituationModel).values(
+            id=situation.id,
+            user_id=situation.user_id,
+            child_id=situation.child_id,
+            created_at=situation.created_at,
+            **situation_row,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[SituationModel.id], set_=situation_row
             )
+        )
 
-            if situation.analysis_result:
-                db_situation.hidden_meaning = situation.analysis_result.hidden_meaning
-                db_situation.immediate_actions = json.dumps(
-                    situation.analysis_result.immediate_actions
-                )
-                db_situation.long_term_recommendations = json.dumps(
-                    situation.analysis_result.long_term_recommendations
-                )
-                db_situation.what_not_to_do = json.dumps(
-                    situation.analysis_result.what_not_to_do
-                )
-                db_situation.emotional_tone = situation.analysis_result.emotional_tone.value
-                db_situation.confidence_score = situation.analysis_result.confidence_score
-
-            self.session.add(db_situation)
-
-        # Process domain events
-        for event in situation.collect_events():
-            # Log or publish event
-            pass
+        # No event bus yet; drop the events recorded since the last save
+        situation.clear_events()
 
     async def get(self, situation_id: UUID) -> Optional[Situation]:
         """Get situation by ID."""
-        stmt = select(SituationModel).where(SituationModel.id == situation_id)
+        stmt = select(*_SITUATION_COLUMNS).where(SituationModel.id == situation_id)
         result = await self.session.execute(stmt)
-        db_situation = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not db_situation:
+        if not row:
             return None
 
-        return self._to_domain(db_situation)
+        return self._to_domain(row)
 
     async def get_user_situations(
         self, user_id: UUID, limit: int = 10, offset: int = 0
     ) -> list[Situation]:
         """Get user's situations."""
         stmt = (
-            select(SituationModel)
+            select(*_SITUATION_COLUMNS)
             .where(SituationModel.user_id == user_id)
             .order_by(SituationModel.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await self.session.execute(stmt)
-        db_situations = result.scalars().all()
 
-        return [self._to_domain(s) for s in db_situations]
+        return [self._to_domain(row) for row in result]
+
+    async def get_user_situations_with_child_names(
+        self, user_id: UUID, limit: int = 10, offset: int = 0
+    ) -> list[tuple[Situation, Optional[str]]]:
+        """Get user's situations joined with their child's name."""
+        stmt = (
+            select(*_SITUATION_COLUMNS, ChildModel.name.label("child_name"))
+            .outerjoin(ChildModel, ChildModel.id == SituationModel.child_id)
+            .where(SituationModel.user_id == user_id)
+            .order_by(SituationModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+
+        return [(self._to_domain(row), row.child_name) for row in result]
 
     async def get_child_situations(
         self, child_id: UUID, limit: int = 10, offset: int = 0
     ) -> list[Situation]:
         """Get child's situations."""
         stmt = (
-            select(SituationModel)
+            select(*_SITUATION_COLUMNS)
             .where(SituationModel.child_id == child_id)
             .order_by(SituationModel.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await self.session.execute(stmt)
-        db_situations = result.scalars().all()
 
-        return [self._to_domain(s) for s in db_situations]
+        return [self._to_domain(row) for row in result]
 
     async def count_user_situations(self, user_id: UUID) -> int:
         """Count user's situations."""
@@ -300,15 +386,12 @@ class SQLAlchemySituationRepository(SituationRepository):
 
     async def delete(self, situation_id: UUID) -> None:
         """Delete situation by ID."""
-        stmt = select(SituationModel).where(SituationModel.id == situation_id)
-        result = await self.session.execute(stmt)
-        db_situation = result.scalar_one_or_none()
-
-        if db_situation:
-            await self.session.delete(db_situation)
+        await self.session.execute(
+            delete(SituationModel).where(SituationModel.id == situation_id)
+        )
 
-    def _to_domain(self, db_situation: SituationModel) -> Situation:
-        """Convert database model to domain aggregate."""
+    def _to_domain(self, db_situation: Row) -> Situation:
+        """Convert a situation row to domain aggregate."""
         situation = Situation(
             id=db_situation.id,
             user_id=db_situation.user_id,
@@ -316,19 +399,19 @@ class SQLAlchemySituationRepository(SituationRepository):
             description=db_situation.description,
             context=db_situation.context,
             created_at=db_situation.created_at,
-            analyzed_at=db_situation.analyzed_at,
         )
 
-        if db_situation.hidden_meaning:
+        analysis = db_situation.analysis
+        if analysis:
             situation.analysis_result = AnalysisResult(
-                hidden_meaning=db_situation.hidden_meaning,
-                immediate_actions=json.loads(db_situation.immediate_actions or "[]"),
-                long_term_recommendations=json.loads(
-                    db_situation.long_term_recommendations or "[]"
+                hidden_meaning=analysis["hidden_meaning"],
+                immediate_actions=tuple(analysis["immediate_actions"]),
+                long_term_recommendations=tuple(
+                    analysis["long_term_recommendations"]
                 ),
-                what_not_to_do=json.loads(db_situation.what_not_to_do or "[]"),
-                emotional_tone=EmotionalTone(db_situation.emotional_tone),
-                confidence_score=db_situation.confidence_score or 0.8,
+                what_not_to_do=tuple(analysis["what_not_to_do"]),
+                emotional_tone=EmotionalTone(analysis["emotional_tone"]),
+                confidence_score=analysis.get("confidence_score") or 0.8,
                 analyzed_at=db_situation.analyzed_at,
             )
 
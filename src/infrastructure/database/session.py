@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,6 +13,20 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from config import settings
+from infrastructure.database.after_commit import run_after_commit
+
+# Server-side TCP keepalives so dropped NAT/load-balancer connections are
+# noticed instead of surfacing as ConnectionDoesNotExistError.
+_KEEPALIVE_SETTINGS = {
+    "tcp_keepalives_idle": "30",
+    "tcp_keepalives_interval": "10",
+    "tcp_keepalives_count": "5",
+}
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON columns with orjson."""
+    return orjson.dumps(value).decode()
 
 
 class DatabaseSessionManager:
@@ -23,8 +38,15 @@ class DatabaseSessionManager:
             database_url,
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
             pool_pre_ping=True,
             echo=settings.database_echo,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            connect_args={
+                "prepared_statement_cache_size": settings.database_statement_cache_size,
+                "server_settings": _KEEPALIVE_SETTINGS,
+            },
         )
         self.async_session = async_sessionmaker(
             self.engine,
@@ -48,6 +70,8 @@ class DatabaseSessionManager:
                 raise
             finally:
                 await session.close()
+        # Cache invalidations and similar side effects wait for the commit
+        await run_after_commit(session)
 
     async def create_all(self) -> None:
         """Create all tables."""
@@ -0,0 +1,41 @@
+"""Shared Anthropic client construction."""
+from __future__ import annotations
+
+from typing import Any, Callable, Protocol
+
+import httpx
+from anthropic import AsyncAnthropic
+
+
+class ClaudeClientSettings(Protocol):
+    """Settings fields the shared Anthropic client is built from."""
+
+    anthropic_api_key: str
+    claude_max_connections: int
+    claude_max_keepalive: int
+    claude_timeout: int
+
+
+def create_anthropic_client(
+    settings: ClaudeClientSettings, *, max_retries: int = 2
+) -> AsyncAnthropic:
+    """Build an Anthropic client over a bounded keep-alive connection pool."""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.claude_max_connections,
+            max_keepalive_connections=settings.claude_max_keepalive,
+        ),
+        timeout=httpx.Timeout(settings.claude_timeout),
+    )
+    return AsyncAnthropic(
+        api_key=settings.anthropic_api_key,
+        http_client=http_client,
+        max_retries=max_retries,
+    )
+
+
+async def close_cached_client(get_client: Callable[[], Any]) -> None:
+    """Close the client held by an ``lru_cache``'d getter, if it built one."""
+    if get_client.cache_info().currsize:  # type: ignore[attr-defined]
+        await get_client().close()
+        get_client.cache_clear()  # type: ignore[attr-defined]
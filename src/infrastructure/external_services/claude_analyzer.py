@@ -1,20 +1,66 @@
 """Claude API analyzer service."""
 
-import json
+from functools import lru_cache
 from typing import Dict, Any
 
+import orjson
 from anthropic import AsyncAnthropic
 
 from src.domain.analysis.aggregates import AIRecommendation
-from src.infrastructure.config.settings import settings
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external_services.anthropic_client import (
+    close_cached_client,
+    create_anthropic_client,
+)
+
+
+_PROMPT_TEMPLATE = """Ты опытный детский психолог и эксперт по воспитанию детей. 
+Родитель обратился к тебе за помощью в понимании поведения ребенка.
+
+Информация о ребенке:
+- Возраст: {child_age} лет
+- Пол: {child_gender}
+
+Ситуация, описанная родителем:
+"{situation}"
+
+Проанализируй ситуацию и предоставь ответ в формате JSON со следующими полями:
+
+{{
+    "hidden_meaning": "Глубинный анализ: что на самом деле может чувствовать или хотеть выразить ребенок через это поведение/слова",
+    "immediate_actions": "Что делать прямо сейчас: конкретные действия, которые родитель может предпринять немедленно",
+    "long_term_recommendations": "Долгосрочные рекомендации: стратегии воспитания и развития отношений с ребенком",
+    "what_not_to_do": "Чего НЕ следует делать: распространенные ошибки, которых нужно избегать в данной ситуации",
+    "confidence_score": 0.85
+}}
+
+Важно:
+1. Учитывай возраст ребенка при анализе
+2. Давай практичные и выполнимые советы
+3. Будь эмпатичным к родителю
+4. Избегай осуждения
+5. Фокусируйся на развитии здоровых отношений между родителем и ребенком
+
+Ответь только JSON без дополнительного текста."""
+
+
+@lru_cache
+def get_anthropic_client() -> AsyncAnthropic:
+    """Get the process-wide Anthropic client and its keep-alive pool."""
+    return create_anthropic_client(get_settings())
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic client on application shutdown."""
+    await close_cached_client(get_anthropic_client)
 
 
 class ClaudeAnalyzer:
     """Claude API analyzer implementation."""
     
     def __init__(self) -> None:
-        self._client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-        self._model = settings.claude_model
+        self._client = get_anthropic_client()
+        self._model = get_settings().claude_model
     
     async def analyze_situation(
         self,
@@ -55,36 +101,9 @@ class ClaudeAnalyzer:
     
     def _build_prompt(self, situation: str, child_age: int, child_gender: str) -> str:
         """Build analysis prompt."""
-        gender_pronoun = "он" if child_gender == "male" else "она" if child_gender == "female" else "ребенок"
-        
-        return f"""Ты опытный детский психолог и эксперт по воспитанию детей. 
-Родитель обратился к тебе за помощью в понимании поведения ребенка.
-
-Информация о ребенке:
-- Возраст: {child_age} лет
-- Пол: {child_gender}
-
-Ситуация, описанная родителем:
-"{situation}"
-
-Проанализируй ситуацию и предоставь ответ в формате JSON со следующими полями:
-
-{{
-    "hidden_meaning": "Глубинный анализ: что на самом деле может чувствовать или хотеть выразить ребенок через это поведение/слова",
-    "immediate_actions": "Что делать прямо сейчас: конкретные действия, которые родитель может предпринять немедленно",
-    "long_term_recommendations": "Долгосрочные рекомендации: стратегии воспитания и развития отношений с ребенком",
-    "what_not_to_do": "Чего НЕ следует делать: распространенные ошибки, которых нужно избегать в данной ситуации",
-    "confidence_score": 0.85
-}}
-
-Важно:
-1. Учитывай возраст ребенка при анализе
-2. Давай практичные и выполнимые советы
-3. Будь эмпатичным к родителю
-4. Избегай осуждения
-5. Фокусируйся на развитии здоровых отношений между родителем и ребенком
-
-Ответь только JSON без дополнительного текста."""
+        return _PROMPT_TEMPLATE.format(
+            child_age=child_age, child_gender=child_gender, situation=situation
+        )
     
     def _parse_response(self, content: str) -> Dict[str, Any]:
         """Parse Claude response."""
@@ -95,7 +114,7 @@ class ClaudeAnalyzer:
             
             if json_start != -1 and json_end > json_start:
                 json_str = content[json_start:json_end]
-                return json.loads(json_str)
+                return orjson.loads(json_str)
             
             # Fallback parsing if JSON extraction fails
             return {
@@ -106,7 +125,7 @@ class ClaudeAnalyzer:
                 "confidence_score": 0.5
             }
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Return default structure if parsing fails
             return {
                 "hidden_meaning": "Анализ ситуации требует внимания",
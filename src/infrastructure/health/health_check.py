@@ -4,13 +4,14 @@ from __future__ import annotations
 import asyncio
 from typing import Dict, Any
 
-from redis.asyncio import Redis
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import settings
+from src.infrastructure.cache.redis import get_redis
 from src.infrastructure.database.session import db_manager
 
+# Per-check budget in seconds, so a hung dependency cannot stall check_all.
+CHECK_TIMEOUT = 2.0
+
 
 class HealthChecker:
     """Health check service."""
@@ -18,13 +19,20 @@ class HealthChecker:
     async def check_database(self) -> Dict[str, Any]:
         """Check database health."""
         try:
-            async with db_manager.session() as session:
-                result = await session.execute(text("SELECT 1"))
-                return {
-                    "status": "healthy",
-                    "service": "database",
-                    "details": {"connected": True}
-                }
+            async with asyncio.timeout(CHECK_TIMEOUT):
+                async with db_manager.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            return {
+                "status": "healthy",
+                "service": "database",
+                "details": {"connected": True}
+            }
+        except TimeoutError:
+            return {
+                "status": "unhealthy",
+                "service": "database",
+                "error": "timeout"
+            }
         except Exception as e:
             return {
                 "status": "unhealthy",
@@ -35,14 +43,19 @@ class HealthChecker:
     async def check_redis(self) -> Dict[str, Any]:
         """Check Redis health."""
         try:
-            redis = Redis.from_url(str(settings.redis_url))
-            await redis.ping()
-            await redis.close()
+            async with asyncio.timeout(CHECK_TIMEOUT):
+                await get_redis().ping()
             return {
                 "status": "healthy",
                 "service": "redis",
                 "details": {"connected": True}
             }
+        except TimeoutError:
+            return {
+                "status": "unhealthy",
+                "service": "redis",
+                "error": "timeout"
+            }
         except Exception as e:
             return {
                 "status": "unhealthy",
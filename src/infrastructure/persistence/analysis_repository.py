@@ -4,7 +4,8 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Row, and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.analysis.aggregates import AIRecommendation, Analysis, AnalysisStatus
@@ -12,6 +13,9 @@ from src.domain.analysis.repositories import AnalysisRepository
 from src.domain.analysis.value_objects import SituationDescription
 from src.infrastructure.persistence.models import AnalysisModel
 
+# Reads build the aggregate straight from rows, without ORM instances.
+_ANALYSIS_COLUMNS = tuple(AnalysisModel.__table__.c)
+
 
 class SqlAlchemyAnalysisRepository(AnalysisRepository):
     """SQLAlchemy implementation of AnalysisRepository."""
@@ -21,57 +25,45 @@ class SqlAlchemyAnalysisRepository(AnalysisRepository):
     
     async def save(self, analysis: Analysis) -> None:
         """Save analysis aggregate."""
-        # Check if analysis exists
-        stmt = select(AnalysisModel).where(AnalysisModel.id == analysis.id)
-        result = await self._session.execute(stmt)
-        db_analysis = result.scalar_one_or_none()
-        
-        if db_analysis:
-            # Update existing analysis
-            db_analysis.status = analysis.status.value
-            db_analysis.completed_at = analysis.completed_at
-            db_analysis.error_message = analysis.error_message
-            
-            if analysis.recommendation:
-                db_analysis.hidden_meaning = analysis.recommendation.hidden_meaning
-                db_analysis.immediate_actions = analysis.recommendation.immediate_actions
-                db_analysis.long_term_recommendations = analysis.recommendation.long_term_recommendations
-                db_analysis.what_not_to_do = analysis.recommendation.what_not_to_do
-                db_analysis.confidence_score = analysis.recommendation.confidence_score
-        else:
-            # Create new analysis
-            db_analysis = AnalysisModel(
-                id=analysis.id,
-                user_id=analysis.user_id,
-                child_id=analysis.child_id,
-                situation_description=str(analysis.situation),
-                status=analysis.status.value,
-                created_at=analysis.created_at,
-                completed_at=analysis.completed_at,
-                error_message=analysis.error_message
+        analysis_row = {
+            "status": analysis.status.name.lower(),
+            "completed_at": analysis.completed_at,
+            "error_message": analysis.error_message,
+        }
+        if analysis.recommendation:
+            analysis_row.update(
+                hidden_meaning=analysis.recommendation.hidden_meaning,
+                immediate_actions=analysis.recommendation.immediate_actions,
+                long_term_recommendations=analysis.recommendation.long_term_recommendations,
+                what_not_to_do=analysis.recommendation.what_not_to_do,
+                confidence_score=analysis.recommendation.confidence_score,
             )
-            
-            if analysis.recommendation:
-                db_analysis.hidden_meaning = analysis.recommendation.hidden_meaning
-                db_analysis.immediate_actions = analysis.recommendation.immediate_actions
-                db_analysis.long_term_recommendations = analysis.recommendation.long_term_recommendations
-                db_analysis.what_not_to_do = analysis.recommendation.what_not_to_do
-                db_analysis.confidence_score = analysis.recommendation.confidence_score
-            
-            self._session.add(db_analysis)
         
-        await self._session.flush()
+        stmt = pg_insert(AnalysisModel).values(
+            id=analysis.id,
+            user_id=analysis.user_id,
+            child_id=analysis.child_id,
+            situation_description=str(analysis.situation),
+            created_at=analysis.created_at,
+            **analysis_row
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[AnalysisModel.id],
+                set_=analysis_row
+            )
+        )
     
     async def get_by_id(self, analysis_id: UUID) -> Optional[Analysis]:
         """Get analysis by ID."""
-        stmt = select(AnalysisModel).where(AnalysisModel.id == analysis_id)
+        stmt = select(*_ANALYSIS_COLUMNS).where(AnalysisModel.id == analysis_id)
         result = await self._session.execute(stmt)
-        db_analysis = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not db_analysis:
+        if not row:
             return None
         
-        return self._to_domain(db_analysis)
+        return self._to_domain(row)
     
     async def get_user_analyses(
         self,
@@ -81,7 +73,7 @@ class SqlAlchemyAnalysisRepository(AnalysisRepository):
     ) -> List[Analysis]:
         """Get user's analyses with pagination."""
         stmt = (
-            select(AnalysisModel)
+            select(*_ANALYSIS_COLUMNS)
             .where(AnalysisModel.user_id == user_id)
             .order_by(AnalysisModel.created_at.desc())
             .limit(limit)
@@ -89,9 +81,8 @@ class SqlAlchemyAnalysisRepository(AnalysisRepository):
         )
         
         result = await self._session.execute(stmt)
-        db_analyses = result.scalars().all()
         
-        return [self._to_domain(db_analysis) for db_analysis in db_analyses]
+        return [self._to_domain(row) for row in result]
     
     async def count_user_analyses_today(self, user_id: UUID) -> int:
         """Count user's analyses created today."""
@@ -110,8 +101,8 @@ class SqlAlchemyAnalysisRepository(AnalysisRepository):
         result = await self._session.execute(stmt)
         return result.scalar() or 0
     
-    def _to_domain(self, db_analysis: AnalysisModel) -> Analysis:
-        """Convert database model to domain aggregate."""
+    def _to_domain(self, db_analysis: Row) -> Analysis:
+        """Convert an analysis row to domain aggregate."""
         recommendation = None
         if db_analysis.hidden_meaning:
             recommendation = AIRecommendation(
@@ -127,7 +118,7 @@ class SqlAlchemyAnalysisRepository(AnalysisRepository):
             user_id=db_analysis.user_id,
             child_id=db_analysis.child_id,
             situation=SituationDescription(db_analysis.situation_description),
-            status=AnalysisStatus(db_analysis.status),
+            status=AnalysisStatus[db_analysis.status.upper()],
             recommendation=recommendation,
             created_at=db_analysis.created_at,
             completed_at=db_analysis.completed_at,
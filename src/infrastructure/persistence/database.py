@@ -1,7 +1,8 @@
 """Database connection and session management."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -10,19 +11,34 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from src.infrastructure.config.settings import settings
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.database.after_commit import run_after_commit
+
+# Server-side TCP keepalives so dropped NAT/load-balancer connections are
+# noticed instead of surfacing as ConnectionDoesNotExistError.
+_KEEPALIVE_SETTINGS = {
+    "tcp_keepalives_idle": "30",
+    "tcp_keepalives_interval": "10",
+    "tcp_keepalives_count": "5",
+}
 
 
 class Database:
     """Database connection manager."""
     
     def __init__(self) -> None:
+        settings = get_settings()
         self._engine: AsyncEngine = create_async_engine(
             settings.postgres_url,
             echo=settings.debug,
-            pool_size=20,
-            max_overflow=10,
+            pool_size=settings.pg_pool_size,
+            max_overflow=settings.pg_max_overflow,
+            pool_recycle=settings.pg_pool_recycle,
             pool_pre_ping=True,
+            connect_args={
+                "prepared_statement_cache_size": settings.pg_statement_cache_size,
+                "server_settings": _KEEPALIVE_SETTINGS,
+            },
         )
         self._session_factory = async_sessionmaker(
             self._engine,
@@ -42,11 +58,22 @@ class Database:
                 raise
             finally:
                 await session.close()
+        # Deferred work such as user cache deletes runs once data is visible
+        await run_after_commit(session)
     
     async def close(self) -> None:
         """Close database connections."""
         await self._engine.dispose()
 
 
-# Global database instance
-database = Database()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_database() -> Database:
+    """Get the process-wide database instance."""
+    return Database()
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``database`` on first access instead of at import time."""
+    if name == "database":
+        return get_database()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
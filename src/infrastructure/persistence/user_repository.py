@@ -1,90 +1,145 @@
 """User repository implementation."""
 
+from datetime import datetime
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy import delete, exists, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.util import identity_key
 
 from src.domain.user.aggregates import Child, User
 from src.domain.user.repositories import UserRepository
 from src.domain.user.value_objects import TelegramId, UserName
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.database.after_commit import call_after_commit
 from src.infrastructure.persistence.models import ChildModel, UserModel
 
+# Eager-load children and fail fast on any other relationship access.
+_LOAD_WITH_CHILDREN = (
+    selectinload(UserModel.children).raiseload("*"),
+    raiseload("*"),
+)
+
+# Cached users live under USER_CACHE_PREFIX + telegram_id.
+USER_CACHE_PREFIX = "user:tg:"
+
+
+def _dump_user(user: User) -> bytes:
+    """Serialize a user aggregate for the cache."""
+    return orjson.dumps({
+        "id": user.id,
+        "telegram_id": user.telegram_id.value,
+        "name": str(user.name),
+        "children": [
+            [child.id, child.name, child.age, child.gender, child.created_at]
+            for child in user.children
+        ],
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "is_active": user.is_active
+    })
+
+
+def _load_user(data: bytes) -> User:
+    """Rebuild a user aggregate from the cache."""
+    cached = orjson.loads(data)
+    return User(
+        id=UUID(cached["id"]),
+        telegram_id=TelegramId(cached["telegram_id"]),
+        name=UserName(cached["name"]),
+        children=[
+            Child(
+                id=UUID(child_id),
+                name=name,
+                age=age,
+                gender=gender,
+                created_at=datetime.fromisoformat(created_at)
+            )
+            for child_id, name, age, gender, created_at in cached["children"]
+        ],
+        created_at=datetime.fromisoformat(cached["created_at"]),
+        updated_at=datetime.fromisoformat(cached["updated_at"]),
+        is_active=cached["is_active"]
+    )
+
 
 class SqlAlchemyUserRepository(UserRepository):
     """SQLAlchemy implementation of UserRepository."""
     
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: Optional[Redis] = None) -> None:
         self._session = session
+        self._cache = cache
     
     async def save(self, user: User) -> None:
         """Save user aggregate."""
-        # Check if user exists
-        stmt = select(UserModel).where(UserModel.id == user.id)
-        result = await self._session.execute(stmt)
-        db_user = result.scalar_one_or_none()
+        stmt = pg_insert(UserModel).values(
+            id=user.id,
+            telegram_id=user.telegram_id.value,
+            name=str(user.name),
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserModel.id],
+                set_={
+                    "name": stmt.excluded.name,
+                    "updated_at": stmt.excluded.updated_at,
+                    "is_active": stmt.excluded.is_active
+                }
+            )
+        )
         
-        if db_user:
-            # Update existing user
-            db_user.name = str(user.name)
-            db_user.updated_at = user.updated_at
-            db_user.is_active = user.is_active
-            
-            # Sync children
-            existing_child_ids = {child.id for child in db_user.children}
-            domain_child_ids = {child.id for child in user.children}
-            
-            # Remove deleted children
-            for db_child in db_user.children[:]:
-                if db_child.id not in domain_child_ids:
-                    self._session.delete(db_child)
-            
-            # Add new children
-            for child in user.children:
-                if child.id not in existing_child_ids:
-                    db_child = ChildModel(
-                        id=child.id,
-                        user_id=user.id,
-                        name=child.name,
-                        age=child.age,
-                        gender=child.gender,
-                        created_at=child.created_at
-                    )
-                    db_user.children.append(db_child)
-        else:
-            # Create new user
-            db_user = UserModel(
-                id=user.id,
-                telegram_id=user.telegram_id.value,
-                name=str(user.name),
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at
+        # Sync children with one DELETE and one executemany INSERT;
+        # children already stored are left as they are
+        await self._session.execute(
+            delete(ChildModel).where(
+                ChildModel.user_id == user.id,
+                ChildModel.id.notin_([child.id for child in user.children])
             )
-            
-            # Add children
-            for child in user.children:
-                db_child = ChildModel(
-                    id=child.id,
-                    user_id=user.id,
-                    name=child.name,
-                    age=child.age,
-                    gender=child.gender,
-                    created_at=child.created_at
-                )
-                db_user.children.append(db_child)
-            
-            self._session.add(db_user)
+        )
+        if user.children:
+            await self._session.execute(
+                pg_insert(ChildModel).on_conflict_do_nothing(
+                    index_elements=[ChildModel.id]
+                ),
+                [
+                    {
+                        "id": child.id,
+                        "user_id": user.id,
+                        "name": child.name,
+                        "age": child.age,
+                        "gender": child.gender,
+                        "created_at": child.created_at
+                    }
+                    for child in user.children
+                ]
+            )
+        
+        # Rows were written behind the ORM's back; reload a loaded copy
+        # on the next read instead of serving it stale
+        db_user = self._session.identity_map.get(identity_key(UserModel, user.id))
+        if db_user is not None:
+            self._session.expire(db_user)
         
-        await self._session.flush()
+        # Invalidate only after commit, or a concurrent read could cache
+        # the old row again
+        if self._cache is not None:
+            call_after_commit(
+                self._session,
+                partial(self._cache.delete, f"{USER_CACHE_PREFIX}{user.telegram_id.value}"),
+            )
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        stmt = select(UserModel).options(
-            selectinload(UserModel.children)
-        ).where(UserModel.id == user_id)
+        stmt = select(UserModel).options(*_LOAD_WITH_CHILDREN).where(UserModel.id == user_id)
         
         result = await self._session.execute(stmt)
         db_user = result.scalar_one_or_none()
@@ -96,9 +151,13 @@ class SqlAlchemyUserRepository(UserRepository):
     
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Get user by Telegram ID."""
-        stmt = select(UserModel).options(
-            selectinload(UserModel.children)
-        ).where(UserModel.telegram_id == telegram_id)
+        cache_key = f"{USER_CACHE_PREFIX}{telegram_id}"
+        if self._cache is not None:
+            cached = await self._cache.get(cache_key)
+            if cached:
+                return _load_user(cached)
+        
+        stmt = select(UserModel).options(*_LOAD_WITH_CHILDREN).where(UserModel.telegram_id == telegram_id)
         
         result = await self._session.execute(stmt)
         db_user = result.scalar_one_or_none()
@@ -106,13 +165,18 @@ class SqlAlchemyUserRepository(UserRepository):
         if not db_user:
             return None
         
-        return self._to_domain(db_user)
+        user = self._to_domain(db_user)
+        if self._cache is not None:
+            await self._cache.set(
+                cache_key, _dump_user(user), ex=get_settings().user_cache_ttl
+            )
+        return user
     
     async def exists_by_telegram_id(self, telegram_id: int) -> bool:
         """Check if user exists by Telegram ID."""
-        stmt = select(UserModel.id).where(UserModel.telegram_id == telegram_id)
+        stmt = select(exists().where(UserModel.telegram_id == telegram_id))
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
     
     def _to_domain(self, db_user: UserModel) -> User:
         """Convert database model to domain aggregate."""
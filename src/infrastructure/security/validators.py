@@ -11,11 +11,13 @@ class InputValidator:
     
     # Patterns for dangerous content
     SCRIPT_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
-    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
-    SQL_KEYWORDS = re.compile(
-        r'\b(DROP|DELETE|INSERT|UPDATE|CREATE|ALTER|EXEC|EXECUTE|UNION|SELECT)\b',
-        re.IGNORECASE
-    )
+    # [^<>] keeps a run of unclosed '<' linear instead of rescanning to the end
+    HTML_TAG_PATTERN = re.compile(r'<[^<>]+>')
+    # No SQL keyword filter: every query binds user text as parameters
+    
+    # Allowed input shapes
+    NAME_PATTERN = re.compile(r"^[a-zA-Zа-яА-ЯёЁ\s\-']+$")
+    USERNAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]{5,32}$")
     
     @classmethod
     def sanitize_text(cls, text: str, max_length: Optional[int] = None) -> str:
@@ -23,11 +25,11 @@ class InputValidator:
         if not text:
             return ""
         
-        # Remove script tags
-        text = cls.SCRIPT_PATTERN.sub("", text)
-        
-        # Remove all HTML tags
-        text = cls.HTML_TAG_PATTERN.sub("", text)
+        # Remove script blocks, then any remaining tags; plain text
+        # (the usual case) has no "<" and skips both passes
+        if "<" in text:
+            text = cls.SCRIPT_PATTERN.sub("", text)
+            text = cls.HTML_TAG_PATTERN.sub("", text)
         
         # Escape HTML entities
         text = html.escape(text)
@@ -48,7 +50,7 @@ class InputValidator:
             raise ValueError("Name cannot be empty")
         
         # Allow only letters, spaces, hyphens, and apostrophes
-        if not re.match(r"^[a-zA-Zа-яА-ЯёЁ\s\-']+$", name):
+        if not cls.NAME_PATTERN.match(name):
             raise ValueError("Name contains invalid characters")
         
         name = cls.sanitize_text(name, max_length=100)
@@ -65,12 +67,7 @@ class InputValidator:
             return None
         
         # Telegram username pattern
-        if not re.match(r"^[a-zA-Z0-9_]{5,32}$", username):
+        if not cls.USERNAME_PATTERN.match(username):
             return None
         
         return username
-    
-    @classmethod
-    def check_sql_injection(cls, text: str) -> bool:
-        """Check if text contains potential SQL injection patterns."""
-        return bool(cls.SQL_KEYWORDS.search(text))
\ No newline at end of file
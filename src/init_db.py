@@ -0,0 +1,24 @@
+"""Create missing tables and apply pending migrations."""
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent))
+
+from infrastructure.database.migrate import init_schema
+from infrastructure.database.session import db_manager
+
+
+async def main() -> None:
+    """Bring the schema up to date without starting the bot."""
+    try:
+        await init_schema()
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
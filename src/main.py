@@ -13,36 +13,46 @@ from redis.asyncio import Redis
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.infrastructure.config.settings import settings
-from src.infrastructure.persistence.database import database
+from src.infrastructure.cache.redis import close_redis
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external_services.claude_analyzer import close_anthropic_client
+from src.infrastructure.persistence.database import get_database
 from src.presentation.telegram.bot import setup_bot
 from src.presentation.telegram.middlewares import setup_middlewares
 
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
 # Get logger
 logger = structlog.get_logger()
 
 
+def setup_logging() -> None:
+    """Configure standard and structured logging from settings."""
+    settings = get_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
 async def main() -> None:
     """Main application function."""
+    settings = get_settings()
     logger.info(
         "Starting Family Emotions Light Bot",
         environment=settings.env,
@@ -76,16 +86,15 @@ async def main() -> None:
         # Cleanup
         await bot.session.close()
         await redis.close()
-        await database.close()
+        await close_redis()
+        await close_anthropic_client()
+        await get_database().close()
         logger.info("Bot stopped")
 
 
 if __name__ == "__main__":
-    # Setup basic logging
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    # Setup logging
+    setup_logging()
     
     # Run bot
     try:
@@ -14,6 +14,7 @@ from application.services.user_service import UserService
 from domain.exceptions import DomainException
 from domain.value_objects import EmotionalTone
 from infrastructure.claude.adapter import ClaudeAdapter
+from infrastructure.cache.redis import get_redis
 from infrastructure.database.session import get_session
 from infrastructure.database.repositories import (
     SQLAlchemySituationRepository,
@@ -30,6 +31,23 @@ from presentation.states import AnalysisStates
 logger = structlog.get_logger()
 router = Router(name="analysis")
 
+_SITUATION_PROMPT = (
+    "Анализ ситуации для {name}\n\n"
+    "Опишите ситуацию, которую хотите проанализировать.\n\n"
+    "Например:\n"
+    "• Ребенок устроил истерику в магазине\n"
+    "• Не хочет делать уроки\n"
+    "• Дерется с другими детьми\n\n"
+    "Чем подробнее опишете, тем точнее будет анализ."
+)
+
+_TONE_EMOJI = {
+    EmotionalTone.POSITIVE: "✅",
+    EmotionalTone.NEUTRAL: "💭",
+    EmotionalTone.CONCERNING: "⚠️",
+    EmotionalTone.URGENT: "🚨",
+}
+
 
 @router.callback_query(F.data == "analyze_situation")
 async def start_analysis(callback: CallbackQuery, state: FSMContext) -> None:
@@ -39,7 +57,7 @@ async def start_analysis(callback: CallbackQuery, state: FSMContext) -> None:
 
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             # Get user
@@ -69,13 +87,7 @@ async def start_analysis(callback: CallbackQuery, state: FSMContext) -> None:
                 child = user.children[0]
                 await state.update_data(child_id=str(child.id))
                 await callback.message.edit_text(
-                    f"Анализ ситуации для {child.name}\n\n"
-                    "Опишите ситуацию, которую хотите проанализировать.\n\n"
-                    "Например:\n"
-                    "• Ребенок устроил истерику в магазине\n"
-                    "• Не хочет делать уроки\n"
-                    "• Дерется с другими детьми\n\n"
-                    "Чем подробнее опишете, тем точнее будет анализ.",
+                    _SITUATION_PROMPT.format(name=child.name),
                     reply_markup=None,
                 )
                 await state.set_state(AnalysisStates.waiting_for_situation)
@@ -107,7 +119,7 @@ async def select_child(callback: CallbackQuery, state: FSMContext) -> None:
     
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             user = await user_service.get_user_by_id(UUID(data["user_id"]))
@@ -115,19 +127,14 @@ async def select_child(callback: CallbackQuery, state: FSMContext) -> None:
                 await callback.answer("Пользователь не найден", show_alert=True)
                 return
 
-            child = next((c for c in user.children if str(c.id) == child_id), None)
+            selected_id = UUID(child_id)
+            child = next((c for c in user.children if c.id == selected_id), None)
             if not child:
                 await callback.answer("Ребенок не найден", show_alert=True)
                 return
 
             await callback.message.edit_text(
-                f"Анализ ситуации для {child.name}\n\n"
-                "Опишите ситуацию, которую хотите проанализировать.\n\n"
-                "Например:\n"
-                "• Ребенок устроил истерику в магазине\n"
-                "• Не хочет делать уроки\n"
-                "• Дерется с другими детьми\n\n"
-                "Чем подробнее опишете, тем точнее будет анализ.",
+                _SITUATION_PROMPT.format(name=child.name),
             )
             await state.set_state(AnalysisStates.waiting_for_situation)
 
@@ -188,7 +195,7 @@ async def analyze_situation(message: Message, state: FSMContext) -> None:
     
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             situation_repo = SQLAlchemySituationRepository(session)
             claude_adapter = ClaudeAdapter()
             
@@ -210,34 +217,30 @@ async def analyze_situation(message: Message, state: FSMContext) -> None:
             await loading_msg.delete()
             
             # Format and send analysis result
-            if situation.analysis_result:
-                result = situation.analysis_result
-                
+            if situation.is_analyzed:
                 # Determine emoji based on emotional tone
-                tone_emoji = {
-                    EmotionalTone.POSITIVE: "✅",
-                    EmotionalTone.NEUTRAL: "💭",
-                    EmotionalTone.CONCERNING: "⚠️",
-                    EmotionalTone.URGENT: "🚨",
-                }.get(result.emotional_tone, "💭")
-                
-                response = f"{tone_emoji} **Анализ ситуации для {situation.child_name}**\n\n"
-                
-                response += f"**🔍 Скрытый смысл:**\n{result.hidden_meaning}\n\n"
+                tone_emoji = _TONE_EMOJI.get(situation.emotional_tone, "💭")
                 
-                response += "**✅ Что делать сейчас:**\n"
-                for i, action in enumerate(result.immediate_actions, 1):
-                    response += f"{i}. {action}\n"
-                response += "\n"
-                
-                response += "**📚 Долгосрочные рекомендации:**\n"
-                for i, rec in enumerate(result.long_term_recommendations, 1):
-                    response += f"{i}. {rec}\n"
-                response += "\n"
-                
-                response += "**❌ Чего НЕ делать:**\n"
-                for i, dont in enumerate(result.what_not_to_do, 1):
-                    response += f"{i}. {dont}\n"
+                parts = [
+                    f"{tone_emoji} **Анализ ситуации для {situation.child_name}**\n\n",
+                    f"**🔍 Скрытый смысл:**\n{situation.hidden_meaning}\n\n",
+                    "**✅ Что делать сейчас:**\n",
+                ]
+                parts.extend(
+                    f"{i}. {action}\n"
+                    for i, action in enumerate(situation.immediate_actions, 1)
+                )
+                parts.append("\n**📚 Долгосрочные рекомендации:**\n")
+                parts.extend(
+                    f"{i}. {rec}\n"
+                    for i, rec in enumerate(situation.long_term_recommendations, 1)
+                )
+                parts.append("\n**❌ Чего НЕ делать:**\n")
+                parts.extend(
+                    f"{i}. {dont}\n"
+                    for i, dont in enumerate(situation.what_not_to_do, 1)
+                )
+                response = "".join(parts)
                 
                 await message.answer(
                     response,
@@ -18,6 +18,7 @@ from application.commands import (
 from application.services.user_service import UserService
 from domain.exceptions import DomainException
 from domain.value_objects import Gender
+from infrastructure.cache.redis import get_redis
 from infrastructure.database.session import get_session
 from infrastructure.database.repositories import SQLAlchemyUserRepository
 from presentation.keyboards import (
@@ -39,7 +40,7 @@ async def reset_handler(message: Message, state: FSMContext) -> None:
     
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             
             # Delete user if exists
             user = await user_repo.get_by_telegram_id(message.from_user.id)
@@ -64,7 +65,7 @@ async def start_handler(message: Message, state: FSMContext) -> None:
 
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             # Check if user exists
@@ -257,7 +258,7 @@ async def process_problem_type(callback: CallbackQuery, state: FSMContext) -> No
     
     try:
         async for session in get_session():
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             # Add child with default age (10 years) for now
@@ -352,7 +353,7 @@ async def process_child_gender(callback: CallbackQuery, state: FSMContext) -> No
     
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             # Add child
@@ -400,7 +401,7 @@ async def complete_onboarding_legacy(callback: CallbackQuery, state: FSMContext)
     
     async for session in get_session():
         try:
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
 
             # Complete onboarding
@@ -10,6 +10,7 @@ from aiogram.types import Message, CallbackQuery
 from application.commands import GetUserCommand
 from application.services.user_service import UserService
 from infrastructure.claude.adapter import ClaudeAdapter
+from infrastructure.cache.redis import get_redis
 from infrastructure.database.session import get_session
 from infrastructure.database.repositories import SQLAlchemyUserRepository
 from presentation.keyboards import cancel_keyboard
@@ -28,7 +29,7 @@ async def start_translation(message: Message, state: FSMContext) -> None:
     
     try:
         async for session in get_session():
-            user_repo = SQLAlchemyUserRepository(session)
+            user_repo = SQLAlchemyUserRepository(session, get_redis())
             user_service = UserService(user_repo)
             
             # Check if user exists and completed onboarding
@@ -1,7 +1,8 @@
 """Bot keyboards."""
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 from uuid import UUID
 
 from aiogram.types import (
@@ -13,7 +14,11 @@ from aiogram.types import (
 
 from application.dto import ChildDTO
 
+# Argument-free keyboards are built once; aiogram markups are frozen
+# models, so every handler can share the same instance.
 
+
+@lru_cache(maxsize=1)
 def main_menu_keyboard() -> ReplyKeyboardMarkup:
     """Create main menu keyboard according to documentation."""
     buttons = [
@@ -24,6 +29,7 @@ def main_menu_keyboard() -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True)
 
 
+@lru_cache(maxsize=1)
 def gender_keyboard() -> InlineKeyboardMarkup:
     """Create gender selection keyboard."""
     buttons = [
@@ -35,6 +41,7 @@ def gender_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=1)
 def yes_no_keyboard() -> InlineKeyboardMarkup:
     """Create yes/no keyboard."""
     buttons = [
@@ -46,7 +53,7 @@ def yes_no_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def child_selection_keyboard(children: list[ChildDTO]) -> InlineKeyboardMarkup:
+def child_selection_keyboard(children: Sequence[ChildDTO]) -> InlineKeyboardMarkup:
     """Create child selection keyboard."""
     buttons = []
     for child in children:
@@ -66,6 +73,7 @@ def child_selection_keyboard(children: list[ChildDTO]) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=1)
 def skip_context_keyboard() -> InlineKeyboardMarkup:
     """Create skip context keyboard."""
     buttons = [
@@ -75,6 +83,7 @@ def skip_context_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=1)
 def back_to_menu_keyboard() -> InlineKeyboardMarkup:
     """Create back to menu keyboard."""
     buttons = [
@@ -83,6 +92,7 @@ def back_to_menu_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@lru_cache(maxsize=1)
 def cancel_keyboard() -> InlineKeyboardMarkup:
     """Create cancel keyboard."""
     buttons = [
@@ -9,6 +9,7 @@ from src.application.commands.analysis_commands import RequestAnalysisCommand
 from src.application.services.analysis_service import AnalysisService
 from src.application.services.user_service import UserService
 from src.infrastructure.cache.rate_limiter import RedisRateLimiter
+from src.infrastructure.cache.redis import get_redis
 from src.infrastructure.external_services.claude_analyzer import ClaudeAnalyzer
 from src.infrastructure.persistence.analysis_repository import SqlAlchemyAnalysisRepository
 from src.infrastructure.persistence.database import database
@@ -27,7 +28,7 @@ async def start_analysis(message: types.Message, state: FSMContext) -> None:
     
     # Get user and children
     async with database.session() as session:
-        repo = SqlAlchemyUserRepository(session)
+        repo = SqlAlchemyUserRepository(session, get_redis())
         service = UserService(repo)
         user = await service.get_user_by_telegram_id(user_id)
     
@@ -79,12 +80,10 @@ async def process_child_selection(
 ) -> None:
     """Process child selection for analysis."""
     child_id = UUID(callback.data.split(":")[1])
-    data = await state.get_data()
-    user_id = UUID(data["user_id"])
     
     # Get child info
     async with database.session() as session:
-        repo = SqlAlchemyUserRepository(session)
+        repo = SqlAlchemyUserRepository(session, get_redis())
         service = UserService(repo)
         user = await service.get_user_by_telegram_id(callback.from_user.id)
     
@@ -126,11 +125,6 @@ async def process_situation(message: types.Message, state: FSMContext) -> None:
         )
         return
     
-    # Check for potential injection attacks
-    if InputValidator.check_sql_injection(situation):
-        await message.answer("Обнаружен недопустимый контент. Попробуйте еще раз.")
-        return
-    
     data = await state.get_data()
     
     # Show processing message
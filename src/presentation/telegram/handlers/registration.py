@@ -5,6 +5,7 @@ from aiogram.fsm.context import FSMContext
 
 from src.application.commands.user_commands import RegisterUserCommand
 from src.application.services.user_service import UserService
+from src.infrastructure.cache.redis import get_redis
 from src.infrastructure.persistence.database import database
 from src.infrastructure.persistence.user_repository import SqlAlchemyUserRepository
 from src.presentation.telegram.keyboards import get_gender_keyboard, get_main_menu
@@ -83,7 +84,7 @@ async def process_child_gender(
     
     # Register user
     async with database.session() as session:
-        repo = SqlAlchemyUserRepository(session)
+        repo = SqlAlchemyUserRepository(session, get_redis())
         service = UserService(repo)
         
         command = RegisterUserCommand(
@@ -5,6 +5,7 @@ from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 
 from src.application.services.user_service import UserService
+from src.infrastructure.cache.redis import get_redis
 from src.infrastructure.persistence.database import database
 from src.infrastructure.persistence.user_repository import SqlAlchemyUserRepository
 from src.presentation.telegram.keyboards import get_main_menu
@@ -20,7 +21,7 @@ async def cmd_start(message: types.Message, state: FSMContext) -> None:
     
     # Check if user exists
     async with database.session() as session:
-        repo = SqlAlchemyUserRepository(session)
+        repo = SqlAlchemyUserRepository(session, get_redis())
         service = UserService(repo)
         user = await service.get_user_by_telegram_id(user_id)
     
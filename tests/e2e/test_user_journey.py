@@ -13,7 +13,7 @@ from application.commands import (
     CompleteOnboardingCommand,
     RegisterUserCommand,
 )
-from application.dto import AnalysisResultDTO, ChildDTO, SituationDTO, UserDTO
+from application.dto import ChildDTO, SituationDTO, UserDTO
 from application.services.analysis_service import AnalysisService
 from application.services.user_service import UserService
 from domain.value_objects import EmotionalTone, Gender
@@ -149,10 +149,10 @@ class TestFullUserJourney:
         assert situation_dto.child_id == child_dto.id
         assert situation_dto.child_name == "Alice"
         assert situation_dto.is_analyzed
-        assert situation_dto.analysis_result is not None
+        assert situation_dto.hidden_meaning is not None
 
         # Verify analysis content
-        analysis = situation_dto.analysis_result
+        analysis = situation_dto
         assert analysis.hidden_meaning == "Ребенок испытывает стресс от учебной нагрузки"
         assert len(analysis.immediate_actions) == 3
         assert len(analysis.long_term_recommendations) == 3
@@ -180,13 +180,6 @@ class TestFullUserJourney:
         mock_situation_repo = Mock()
         mock_claude_adapter = Mock(spec=ClaudeAdapter)
 
-        user_service = UserService(mock_user_repo)
-        analysis_service = AnalysisService(
-            mock_user_repo,
-            mock_situation_repo,
-            mock_claude_adapter,
-        )
-
         # Mock Claude responses for different children
         mock_claude_adapter.analyze_situation = AsyncMock(side_effect=[
             {
@@ -207,6 +200,13 @@ class TestFullUserJourney:
             },
         ])
 
+        user_service = UserService(mock_user_repo)
+        analysis_service = AnalysisService(
+            mock_user_repo,
+            mock_situation_repo,
+            mock_claude_adapter,
+        )
+
         # Step 1: Register user
         register_command = RegisterUserCommand(
             telegram_id=self.telegram_id,
@@ -279,12 +279,12 @@ class TestFullUserJourney:
 
         # Verify both analyses
         assert situation1_dto.child_name == "Bob"
-        assert situation1_dto.analysis_result.emotional_tone == EmotionalTone.NEUTRAL
-        assert "ревнует" in situation1_dto.analysis_result.hidden_meaning
+        assert situation1_dto.emotional_tone == EmotionalTone.NEUTRAL
+        assert "ревнует" in situation1_dto.hidden_meaning
 
         assert situation2_dto.child_name == "Emma"
-        assert situation2_dto.analysis_result.emotional_tone == EmotionalTone.POSITIVE
-        assert "копирует" in situation2_dto.analysis_result.hidden_meaning
+        assert situation2_dto.emotional_tone == EmotionalTone.POSITIVE
+        assert "копирует" in situation2_dto.hidden_meaning
 
         # Verify Claude was called twice with different parameters
         assert mock_claude_adapter.analyze_situation.call_count == 2
@@ -5,10 +5,20 @@ import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
+import anthropic
+import httpx
 import pytest
 from anthropic import AsyncAnthropic
 
-from infrastructure.claude.adapter import ClaudeAdapter
+from infrastructure.claude.adapter import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ClaudeAdapter,
+    get_anthropic_client,
+    get_circuit_breaker,
+)
+
+CLAUDE_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
 
 
 class TestClaudeAdapterIntegration:
@@ -17,8 +27,17 @@ class TestClaudeAdapterIntegration:
     def setup_method(self) -> None:
         """Set up test dependencies."""
         self.adapter = None  # Will be created in tests to avoid API calls
+        get_anthropic_client.cache_clear()
+        get_circuit_breaker.cache_clear()
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Patch adapter settings with the pool limits the shared client needs."""
+        with patch("infrastructure.claude.adapter.settings") as mock_settings:
+            mock_settings.claude_max_connections = 10
+            mock_settings.claude_max_keepalive = 10
+            yield mock_settings
 
-    @patch("infrastructure.claude.adapter.settings")
     def test_adapter_initialization(self, mock_settings) -> None:
         """Test Claude adapter initialization."""
         # Mock settings
@@ -36,65 +55,64 @@ class TestClaudeAdapterIntegration:
         assert adapter.temperature == 0.7
         assert adapter.retry_attempts == 3
         assert isinstance(adapter.client, AsyncAnthropic)
+        # Retries are left to the adapter and its circuit breaker
+        assert adapter.client.max_retries == 0
 
-    async def test_build_prompt_with_all_parameters(self) -> None:
+    async def test_build_prompt_with_all_parameters(self, mock_settings) -> None:
         """Test building prompt with all parameters."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_model = "claude-3-sonnet-20240229"
-            mock_settings.claude_max_tokens = 2000
-            mock_settings.claude_temperature = 0.7
-            mock_settings.claude_retry_attempts = 3
-
-            adapter = ClaudeAdapter()
-
-            prompt = adapter._build_prompt(
-                situation="Ребенок не хочет идти в школу",
-                child_age="7 лет",
-                child_gender="male",
-                context="Это началось на этой неделе",
-            )
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_model = "claude-3-sonnet-20240229"
+        mock_settings.claude_max_tokens = 2000
+        mock_settings.claude_temperature = 0.7
+        mock_settings.claude_retry_attempts = 3
 
-            # Check that all parameters are included in prompt
-            assert "Ребенок не хочет идти в школу" in prompt
-            assert "7 лет" in prompt
-            assert "мальчик" in prompt
-            assert "Это началось на этой неделе" in prompt
-            assert "он" in prompt  # Male pronoun
-            assert "JSON" in prompt
-            assert "emotional_tone" in prompt
+        adapter = ClaudeAdapter()
 
-    async def test_build_prompt_without_context(self) -> None:
+        prompt = adapter._build_prompt(
+            situation="Ребенок не хочет идти в школу",
+            child_age="7 лет",
+            child_gender="male",
+            context="Это началось на этой неделе",
+        )
+
+        # Check that all parameters are included in prompt
+        assert "Ребенок не хочет идти в школу" in prompt
+        assert "7 лет" in prompt
+        assert "мальчик" in prompt
+        assert "Это началось на этой неделе" in prompt
+        assert "он" in prompt  # Male pronoun
+        assert "JSON" in prompt
+        assert "emotional_tone" in prompt
+
+    async def test_build_prompt_without_context(self, mock_settings) -> None:
         """Test building prompt without context."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_model = "claude-3-sonnet-20240229"
-            mock_settings.claude_max_tokens = 2000
-            mock_settings.claude_temperature = 0.7
-            mock_settings.claude_retry_attempts = 3
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_model = "claude-3-sonnet-20240229"
+        mock_settings.claude_max_tokens = 2000
+        mock_settings.claude_temperature = 0.7
+        mock_settings.claude_retry_attempts = 3
 
-            adapter = ClaudeAdapter()
+        adapter = ClaudeAdapter()
 
-            prompt = adapter._build_prompt(
-                situation="Ребенок капризничает",
-                child_age="5 лет",
-                child_gender="female",
-                context=None,
-            )
+        prompt = adapter._build_prompt(
+            situation="Ребенок капризничает",
+            child_age="5 лет",
+            child_gender="female",
+            context=None,
+        )
 
-            assert "Ребенок капризничает" in prompt
-            assert "5 лет" in prompt
-            assert "девочка" in prompt
-            assert "она" in prompt  # Female pronoun
-            assert "Дополнительный контекст:" not in prompt
+        assert "Ребенок капризничает" in prompt
+        assert "5 лет" in prompt
+        assert "девочка" in prompt
+        assert "она" in prompt  # Female pronoun
+        assert "Дополнительный контекст:" not in prompt
 
-    async def test_parse_valid_response(self) -> None:
+    async def test_parse_valid_response(self, mock_settings) -> None:
         """Test parsing valid Claude response."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
 
-            valid_response = """Here is the analysis:
+        valid_response = """Here is the analysis:
 
 {
     "hidden_meaning": "Ребенок испытывает стресс",
@@ -116,22 +134,21 @@ class TestClaudeAdapterIntegration:
 
 That's my analysis."""
 
-            result = adapter._parse_response(valid_response)
+        result = adapter._parse_response(valid_response)
 
-            assert result["hidden_meaning"] == "Ребенок испытывает стресс"
-            assert len(result["immediate_actions"]) == 2
-            assert len(result["long_term_recommendations"]) == 2
-            assert len(result["what_not_to_do"]) == 2
-            assert result["emotional_tone"] == "concerning"
-            assert result["confidence_score"] == 0.85
+        assert result["hidden_meaning"] == "Ребенок испытывает стресс"
+        assert len(result["immediate_actions"]) == 2
+        assert len(result["long_term_recommendations"]) == 2
+        assert len(result["what_not_to_do"]) == 2
+        assert result["emotional_tone"] == "concerning"
+        assert result["confidence_score"] == 0.85
 
-    async def test_parse_response_without_confidence_score(self) -> None:
+    async def test_parse_response_without_confidence_score(self, mock_settings) -> None:
         """Test parsing response without confidence score (should add default)."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
 
-            response_without_confidence = """{
+        response_without_confidence = """{
     "hidden_meaning": "Ребенок устал",
     "immediate_actions": ["Дать отдохнуть"],
     "long_term_recommendations": ["Режим сна"],
@@ -139,17 +156,16 @@ That's my analysis."""
     "emotional_tone": "neutral"
 }"""
 
-            result = adapter._parse_response(response_without_confidence)
+        result = adapter._parse_response(response_without_confidence)
 
-            assert result["confidence_score"] == 0.8  # Default value
+        assert result["confidence_score"] == 0.8  # Default value
 
-    async def test_parse_response_invalid_emotional_tone(self) -> None:
+    async def test_parse_response_invalid_emotional_tone(self, mock_settings) -> None:
         """Test parsing response with invalid emotional tone (should fix to neutral)."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
 
-            response_invalid_tone = """{
+        response_invalid_tone = """{
     "hidden_meaning": "Ребенок устал",
     "immediate_actions": ["Дать отдохнуть"],
     "long_term_recommendations": ["Режим сна"],
@@ -158,61 +174,84 @@ That's my analysis."""
     "confidence_score": 0.9
 }"""
 
-            result = adapter._parse_response(response_invalid_tone)
+        result = adapter._parse_response(response_invalid_tone)
+
+        assert result["emotional_tone"] == "neutral"  # Fixed value
+
+    async def test_parse_response_with_trailing_braces(self, mock_settings) -> None:
+        """Test parsing JSON followed by prose that contains braces."""
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
+
+        response_with_trailing_text = """{
+    "hidden_meaning": "Ребенок устал",
+    "immediate_actions": ["Дать отдохнуть"],
+    "long_term_recommendations": ["Режим сна"],
+    "what_not_to_do": ["Не заставлять"],
+    "emotional_tone": "positive",
+    "confidence_score": 0.9
+}
+
+Note: fields such as {emotional_tone} may vary."""
+
+        result = adapter._parse_response(response_with_trailing_text)
 
-            assert result["emotional_tone"] == "neutral"  # Fixed value
+        assert result["hidden_meaning"] == "Ребенок устал"
+        assert result["emotional_tone"] == "positive"
+        assert result["confidence_score"] == 0.9
 
-    async def test_parse_invalid_json_response(self) -> None:
+    async def test_parse_invalid_json_response(self, mock_settings) -> None:
         """Test parsing invalid JSON response (should return default)."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
 
-            invalid_response = "This is not a JSON response at all"
+        invalid_response = "This is not a JSON response at all"
 
-            result = adapter._parse_response(invalid_response)
+        result = adapter._parse_response(invalid_response)
 
-            # Should return default response
-            assert "hidden_meaning" in result
-            assert "immediate_actions" in result
-            assert "long_term_recommendations" in result
-            assert "what_not_to_do" in result
-            assert result["emotional_tone"] == "neutral"
-            assert result["confidence_score"] == 0.5
+        # Should return default response
+        assert "hidden_meaning" in result
+        assert "immediate_actions" in result
+        assert "long_term_recommendations" in result
+        assert "what_not_to_do" in result
+        assert result["emotional_tone"] == "neutral"
+        assert result["confidence_score"] == 0.5
 
-    async def test_parse_incomplete_json_response(self) -> None:
+    async def test_parse_incomplete_json_response(self, mock_settings) -> None:
         """Test parsing JSON response missing required fields."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
 
-            incomplete_response = """{
+        incomplete_response = """{
     "hidden_meaning": "Ребенок устал",
     "immediate_actions": ["Дать отдохнуть"]
 }"""
 
-            result = adapter._parse_response(incomplete_response)
+        result = adapter._parse_response(incomplete_response)
 
-            # Should return default response
-            assert result["emotional_tone"] == "neutral"
-            assert result["confidence_score"] == 0.5
+        # Should return default response
+        assert result["emotional_tone"] == "neutral"
+        assert result["confidence_score"] == 0.5
 
-    async def test_analyze_situation_success(self) -> None:
+    async def test_analyze_situation_success(self, mock_settings) -> None:
         """Test successful situation analysis with mocked Claude API."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_model = "claude-3-sonnet-20240229"
-            mock_settings.claude_max_tokens = 2000
-            mock_settings.claude_temperature = 0.7
-            mock_settings.claude_retry_attempts = 3
-            mock_settings.claude_timeout = 30
-
-            adapter = ClaudeAdapter()
-
-            # Mock the Claude API call
-            mock_response = Mock()
-            mock_response.content = [Mock()]
-            mock_response.content[0].text = """{
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_model = "claude-3-sonnet-20240229"
+        mock_settings.claude_max_tokens = 2000
+        mock_settings.claude_temperature = 0.7
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
+
+        adapter = ClaudeAdapter()
+
+        # Mock the Claude API call
+        mock_response = Mock()
+        mock_response.content = [Mock()]
+        mock_response.content[0].text = """{
     "hidden_meaning": "Ребенок испытывает страх перед школой",
     "immediate_actions": [
         "Поговорить с ребенком о его переживаниях",
@@ -230,82 +269,88 @@ That's my analysis."""
     "confidence_score": 0.9
 }"""
 
-            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-                mock_create.return_value = mock_response
+        with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = mock_response
 
-                result = await adapter.analyze_situation(
-                    situation="Ребенок не хочет идти в школу и плачет каждое утро",
-                    child_age="6 лет",
-                    child_gender="female",
-                    context="Начался новый учебный год",
-                )
+            result = await adapter.analyze_situation(
+                situation="Ребенок не хочет идти в школу и плачет каждое утро",
+                child_age="6 лет",
+                child_gender="female",
+                context="Начался новый учебный год",
+            )
 
-                # Verify API was called
-                mock_create.assert_called_once()
-                call_args = mock_create.call_args
-                assert call_args[1]["model"] == "claude-3-sonnet-20240229"
-                assert call_args[1]["max_tokens"] == 2000
-                assert call_args[1]["temperature"] == 0.7
+            # Verify API was called
+            mock_create.assert_called_once()
+            call_args = mock_create.call_args
+            assert call_args[1]["model"] == "claude-3-sonnet-20240229"
+            assert call_args[1]["max_tokens"] == 2000
+            assert call_args[1]["temperature"] == 0.7
 
-                # Verify response parsing
-                assert result["hidden_meaning"] == "Ребенок испытывает страх перед школой"
-                assert len(result["immediate_actions"]) == 2
-                assert result["emotional_tone"] == "concerning"
-                assert result["confidence_score"] == 0.9
+            # Verify response parsing
+            assert result["hidden_meaning"] == "Ребенок испытывает страх перед школой"
+            assert len(result["immediate_actions"]) == 2
+            assert result["emotional_tone"] == "concerning"
+            assert result["confidence_score"] == 0.9
 
-    async def test_analyze_situation_with_retry_on_timeout(self) -> None:
+    async def test_analyze_situation_with_retry_on_timeout(self, mock_settings) -> None:
         """Test situation analysis with retry on timeout."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_model = "claude-3-sonnet-20240229"
-            mock_settings.claude_max_tokens = 2000
-            mock_settings.claude_temperature = 0.7
-            mock_settings.claude_retry_attempts = 3
-            mock_settings.claude_timeout = 0.001  # Very short timeout
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_model = "claude-3-sonnet-20240229"
+        mock_settings.claude_max_tokens = 2000
+        mock_settings.claude_temperature = 0.7
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 0.001  # Very short timeout
 
-            adapter = ClaudeAdapter()
+        adapter = ClaudeAdapter()
 
-            # Mock Claude API to be slow (causing timeout)
-            mock_response = Mock()
-            mock_response.content = [Mock()]
-            mock_response.content[0].text = '{"hidden_meaning": "test"}'
+        # Mock Claude API to be slow (causing timeout)
+        mock_response = Mock()
+        mock_response.content = [Mock()]
+        mock_response.content[0].text = '{"hidden_meaning": "test"}'
 
-            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-                # First call times out, second succeeds
-                async def slow_then_fast(*args, **kwargs):
-                    if mock_create.call_count == 1:
-                        await asyncio.sleep(0.1)  # This will timeout
-                    return mock_response
+        with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            # First call times out, second succeeds
+            async def slow_then_fast(*args, **kwargs):
+                if mock_create.call_count == 1:
+                    await asyncio.sleep(0.1)  # This will timeout
+                return mock_response
 
-                mock_create.side_effect = slow_then_fast
+            mock_create.side_effect = slow_then_fast
 
-                with pytest.raises(asyncio.TimeoutError):
-                    await adapter.analyze_situation(
-                        situation="Test situation",
-                        child_age="5 лет",
-                        child_gender="male",
-                    )
+            with pytest.raises(asyncio.TimeoutError):
+                await adapter.analyze_situation(
+                    situation="Test situation",
+                    child_age="5 лет",
+                    child_gender="male",
+                )
 
-                # Should have been called the maximum number of times
-                assert mock_create.call_count == 3
+            # Should have been called the maximum number of times
+            assert mock_create.call_count == 3
 
-    async def test_analyze_situation_with_retry_on_exception(self) -> None:
+    async def test_analyze_situation_with_retry_on_exception(self, mock_settings) -> None:
         """Test situation analysis with retry on API exception."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_model = "claude-3-sonnet-20240229"
-            mock_settings.claude_retry_attempts = 2
-            mock_settings.claude_timeout = 30
-
-            adapter = ClaudeAdapter()
-
-            # Mock the sleep to speed up tests
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-                    # First call fails, second succeeds
-                    mock_response = Mock()
-                    mock_response.content = [Mock()]
-                    mock_response.content[0].text = """{
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_model = "claude-3-sonnet-20240229"
+        mock_settings.claude_retry_attempts = 2
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
+
+        adapter = ClaudeAdapter()
+
+        # Mock the sleep to speed up tests
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+                # First call fails, second succeeds
+                mock_response = Mock()
+                mock_response.content = [Mock()]
+                mock_response.content[0].text = """{
     "hidden_meaning": "Success on retry",
     "immediate_actions": ["Action"],
     "long_term_recommendations": ["Rec"],
@@ -313,45 +358,50 @@ That's my analysis."""
     "emotional_tone": "neutral"
 }"""
 
-                    mock_create.side_effect = [
-                        Exception("API error"),
-                        mock_response,
-                    ]
+                mock_create.side_effect = [
+                    anthropic.APIConnectionError(request=CLAUDE_REQUEST),
+                    mock_response,
+                ]
 
-                    result = await adapter.analyze_situation(
-                        situation="Test situation",
-                        child_age="5 лет",
-                        child_gender="male",
-                    )
+                result = await adapter.analyze_situation(
+                    situation="Test situation",
+                    child_age="5 лет",
+                    child_gender="male",
+                )
 
-                    # Should have retried once
-                    assert mock_create.call_count == 2
-                    assert result["hidden_meaning"] == "Success on retry"
+                # Should have retried once
+                assert mock_create.call_count == 2
+                assert result["hidden_meaning"] == "Success on retry"
 
-    async def test_analyze_situation_all_retries_fail(self) -> None:
+    async def test_analyze_situation_all_retries_fail(self, mock_settings) -> None:
         """Test situation analysis when all retries fail."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_retry_attempts = 2
-            mock_settings.claude_timeout = 30
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_retry_attempts = 2
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
 
-            adapter = ClaudeAdapter()
+        adapter = ClaudeAdapter()
 
-            # Mock the sleep to speed up tests
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-                    # All calls fail
-                    mock_create.side_effect = Exception("Persistent API error")
+        # Mock the sleep to speed up tests
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+                # All calls fail
+                mock_create.side_effect = anthropic.APIConnectionError(
+                    message="Persistent API error", request=CLAUDE_REQUEST
+                )
 
-                    with pytest.raises(Exception, match="Persistent API error"):
-                        await adapter.analyze_situation(
-                            situation="Test situation",
-                            child_age="5 лет",
-                            child_gender="male",
-                        )
+                with pytest.raises(Exception, match="Persistent API error"):
+                    await adapter.analyze_situation(
+                        situation="Test situation",
+                        child_age="5 лет",
+                        child_gender="male",
+                    )
 
-                    # Should have tried the maximum number of times
-                    assert mock_create.call_count == 2
+                # Should have tried the maximum number of times
+                assert mock_create.call_count == 2
 
     @pytest.mark.parametrize(
         "gender,expected_pronoun,expected_gender_word",
@@ -362,66 +412,214 @@ That's my analysis."""
         ],
     )
     async def test_build_prompt_gender_handling(
-        self, gender: str, expected_pronoun: str, expected_gender_word: str
+        self, mock_settings, gender: str, expected_pronoun: str, expected_gender_word: str
     ) -> None:
         """Test that prompt builder handles different genders correctly."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
+
+        prompt = adapter._build_prompt(
+            situation="Test situation",
+            child_age="5 лет",
+            child_gender=gender,
+        )
+
+        assert expected_pronoun in prompt
+        assert expected_gender_word in prompt
+
+    async def test_empty_claude_response(self, mock_settings) -> None:
+        """Test handling of empty Claude response."""
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_timeout = 30
+        mock_settings.claude_retry_attempts = 1
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+
+        adapter = ClaudeAdapter()
+
+        # Mock empty response
+        mock_response = Mock()
+        mock_response.content = []
+
+        with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = mock_response
 
-            prompt = adapter._build_prompt(
+            result = await adapter.analyze_situation(
                 situation="Test situation",
                 child_age="5 лет",
-                child_gender=gender,
+                child_gender="male",
             )
 
-            assert expected_pronoun in prompt
-            assert expected_gender_word in prompt
+            # Should return default response
+            assert result["emotional_tone"] == "neutral"
+            assert result["confidence_score"] == 0.5
 
-    async def test_empty_claude_response(self) -> None:
-        """Test handling of empty Claude response."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            mock_settings.claude_timeout = 30
-            mock_settings.claude_retry_attempts = 1
+    async def test_malformed_json_in_response(self, mock_settings) -> None:
+        """Test handling of malformed JSON in Claude response."""
+        mock_settings.anthropic_api_key = "test-key"
+        adapter = ClaudeAdapter()
+
+        malformed_responses = [
+            '{"hidden_meaning": "test", "immediate_actions": [',  # Incomplete JSON
+            '{"hidden_meaning": "test" "immediate_actions": []}',  # Missing comma
+            'Not JSON at all {invalid}',
+            '',  # Empty string
+        ]
+
+        for malformed_response in malformed_responses:
+            result = adapter._parse_response(malformed_response)
+                
+            # Should return default response for all malformed inputs
+            assert result["emotional_tone"] == "neutral"
+            assert result["confidence_score"] == 0.5
+            assert "immediate_actions" in result
+            assert isinstance(result["immediate_actions"], list)
+    async def test_analyze_situation_respects_total_deadline(self, mock_settings) -> None:
+        """Test that retries stop once the shared deadline is spent."""
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 0.05
+        mock_settings.claude_timeout = 30
 
-            adapter = ClaudeAdapter()
+        adapter = ClaudeAdapter()
 
-            # Mock empty response
-            mock_response = Mock()
-            mock_response.content = []
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(1)
 
-            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-                mock_create.return_value = mock_response
+        with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = slow
 
-                result = await adapter.analyze_situation(
+            with pytest.raises(asyncio.TimeoutError):
+                await adapter.analyze_situation(
                     situation="Test situation",
                     child_age="5 лет",
                     child_gender="male",
                 )
 
-                # Should return default response
-                assert result["emotional_tone"] == "neutral"
-                assert result["confidence_score"] == 0.5
+            # The first attempt used the whole budget
+            assert mock_create.call_count == 1
 
-    async def test_malformed_json_in_response(self) -> None:
-        """Test handling of malformed JSON in Claude response."""
-        with patch("infrastructure.claude.adapter.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-key"
-            adapter = ClaudeAdapter()
-
-            malformed_responses = [
-                '{"hidden_meaning": "test", "immediate_actions": [',  # Incomplete JSON
-                '{"hidden_meaning": "test" "immediate_actions": []}',  # Missing comma
-                'Not JSON at all {invalid}',
-                '',  # Empty string
-            ]
-
-            for malformed_response in malformed_responses:
-                result = adapter._parse_response(malformed_response)
-                
-                # Should return default response for all malformed inputs
-                assert result["emotional_tone"] == "neutral"
-                assert result["confidence_score"] == 0.5
-                assert "immediate_actions" in result
-                assert isinstance(result["immediate_actions"], list)
\ No newline at end of file
+    async def test_concurrent_identical_analyses_share_one_call(self, mock_settings) -> None:
+        """Test that identical in-flight analyses are coalesced."""
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
+
+        adapter = ClaudeAdapter()
+
+        mock_response = Mock()
+        mock_response.content = [Mock()]
+        mock_response.content[0].text = """{
+    "hidden_meaning": "Shared",
+    "immediate_actions": ["Action"],
+    "long_term_recommendations": ["Rec"],
+    "what_not_to_do": ["Don't"],
+    "emotional_tone": "neutral"
+}"""
+
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = slow_response
+
+            first, second, other = await asyncio.gather(
+                adapter.analyze_situation("Same", "5 лет", "male"),
+                ClaudeAdapter().analyze_situation("Same", "5 лет", "male"),
+                adapter.analyze_situation("Different", "5 лет", "male"),
+            )
+
+            assert mock_create.call_count == 2
+            assert first == second
+            assert first is not second
+            assert other["hidden_meaning"] == "Shared"
+
+    async def test_analyze_situation_does_not_retry_client_errors(self, mock_settings) -> None:
+        """Test that 4xx errors are raised without consuming retries."""
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 5
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
+
+        adapter = ClaudeAdapter()
+
+        error = anthropic.BadRequestError(
+            message="Invalid request",
+            response=httpx.Response(400, request=CLAUDE_REQUEST),
+            body=None,
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+                mock_create.side_effect = error
+
+                with pytest.raises(anthropic.BadRequestError):
+                    await adapter.analyze_situation(
+                        situation="Test situation",
+                        child_age="5 лет",
+                        child_gender="male",
+                    )
+
+                assert mock_create.call_count == 1
+
+    async def test_analyze_situation_fails_fast_when_circuit_open(self, mock_settings) -> None:
+        """Test that an open circuit short-circuits further Claude calls."""
+        mock_settings.anthropic_api_key = "test-key"
+        mock_settings.claude_retry_attempts = 3
+        mock_settings.claude_max_backoff = 8.0
+        mock_settings.claude_circuit_failure_threshold = 2
+        mock_settings.claude_circuit_recovery_time = 30
+        mock_settings.claude_total_deadline = 60
+        mock_settings.claude_timeout = 30
+
+        adapter = ClaudeAdapter()
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(adapter.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+                mock_create.side_effect = anthropic.APIConnectionError(
+                    request=CLAUDE_REQUEST
+                )
+
+                with pytest.raises(CircuitOpenError):
+                    await adapter.analyze_situation(
+                        situation="Test situation",
+                        child_age="5 лет",
+                        child_gender="male",
+                    )
+
+                # Third attempt never reaches the API
+                assert mock_create.call_count == 2
+
+
+class TestCircuitBreaker:
+    """Circuit breaker state transitions."""
+
+    def test_opens_after_threshold_and_half_opens_after_recovery(self) -> None:
+        """Test open, half-open and close transitions."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=30)
+
+        with patch("infrastructure.claude.adapter.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert breaker.allow()
+            breaker.record_failure()
+            assert not breaker.allow()
+
+        with patch("infrastructure.claude.adapter.time.monotonic", return_value=131.0):
+            # One trial call per recovery window
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_success()
+            assert breaker.allow()
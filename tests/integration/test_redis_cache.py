@@ -1,14 +1,22 @@
 """Integration tests for Redis cache and rate limiter."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 from redis.asyncio import Redis
 
-from infrastructure.cache.rate_limiter import RedisRateLimiter
+from domain.aggregates.user import User
+from domain.value_objects import Gender
+from infrastructure.cache.rate_limiter import KEY_PREFIX, RedisRateLimiter, _gcra_script
+from infrastructure.cache.redis import close_redis, get_redis
+from infrastructure.database.after_commit import run_after_commit
+from infrastructure.database.repositories import (
+    USER_CACHE_PREFIX,
+    SQLAlchemyUserRepository,
+)
 
 
 class MockRedis:
@@ -18,24 +26,49 @@ class MockRedis:
         self.data = {}
         self.expires = {}
 
-    async def get(self, key: str) -> str | None:
-        """Get value from mock Redis."""
-        if key in self.expires and datetime.utcnow() > self.expires[key]:
-            del self.data[key]
-            del self.expires[key]
-            return None
+    def register_script(self, script: str):
+        """Register a Lua script (emulates the GCRA rate limiter script)."""
+
+        async def run(keys: list[str], args: list) -> list[int]:
+            (key,) = keys
+            now, cost, commit, *envelopes = args
+            stored = self.data.get(key, {})
+            tats = []
+            new_tats = []
+            allowed = 1
+            for name, burst, interval in zip(
+                ("day", "hour"), envelopes[::2], envelopes[1::2]
+            ):
+                tat = max(stored.get(name, now), now)
+                tats.append(tat)
+                new_tats.append(tat + interval * cost)
+                if new_tats[-1] - burst * interval > now:
+                    allowed = 0
+            final = new_tats if allowed else tats
+            remaining = [
+                max(int(burst - (tat - now) / interval), 0)
+                for tat, burst, interval in zip(final, envelopes[::2], envelopes[1::2])
+            ]
+            if allowed and commit and cost:
+                self.data[key] = dict(zip(("day", "hour"), new_tats))
+                self.expires[key] = max(final) - now
+            return [allowed, *remaining]
+
+        return run
+
+    async def get(self, key: str):
+        """Get a string value."""
         return self.data.get(key)
 
-    async def incr(self, key: str) -> int:
-        """Increment value in mock Redis."""
-        current = int(self.data.get(key, 0))
-        new_value = current + 1
-        self.data[key] = str(new_value)
-        return new_value
+    async def set(self, key: str, value, ex: int | None = None) -> None:
+        """Set a string value with optional expiry."""
+        self.data[key] = value
+        self.expires[key] = ex
 
-    async def expire(self, key: str, ttl: timedelta) -> None:
-        """Set expiration for key in mock Redis."""
-        self.expires[key] = datetime.utcnow() + ttl
+    async def delete(self, key: str) -> None:
+        """Delete a key."""
+        self.data.pop(key, None)
+        self.expires.pop(key, None)
 
     async def close(self) -> None:
         """Close mock Redis connection."""
@@ -54,12 +87,16 @@ class TestRedisRateLimiter:
         """Set up test dependencies."""
         self.mock_redis = MockRedis()
         self.user_id = uuid4()
+        get_redis.cache_clear()
 
+    @patch("infrastructure.cache.redis.settings")
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
-    def test_rate_limiter_initialization(self, mock_redis_from_url, mock_settings) -> None:
+    @patch("infrastructure.cache.redis.Redis.from_url")
+    def test_rate_limiter_initialization(
+        self, mock_redis_from_url, mock_settings, mock_redis_settings
+    ) -> None:
         """Test rate limiter initialization."""
-        mock_settings.redis_url = "redis://localhost:6379"
+        mock_redis_settings.redis_url = "redis://localhost:6379"
         mock_settings.max_requests_per_user_per_day = 100
         mock_settings.max_requests_per_user_per_hour = 10
         mock_redis_from_url.return_value = self.mock_redis
@@ -68,10 +105,31 @@ class TestRedisRateLimiter:
 
         assert rate_limiter._daily_limit == 100
         assert rate_limiter._hourly_limit == 10
-        mock_redis_from_url.assert_called_once_with("redis://localhost:6379", decode_responses=True)
+        mock_redis_from_url.assert_called_once_with(
+            "redis://localhost:6379",
+            decode_responses=True,
+            max_connections=mock_redis_settings.redis_pool_size,
+            health_check_interval=30,
+        )
+
+    @patch("infrastructure.cache.rate_limiter.settings")
+    @patch("infrastructure.cache.redis.Redis.from_url")
+    def test_rate_limiters_share_redis_client(self, mock_redis_from_url, mock_settings) -> None:
+        """Test rate limiters reuse one Redis client and connection pool."""
+        mock_settings.redis_url = "redis://localhost:6379"
+        mock_settings.max_requests_per_user_per_day = 100
+        mock_settings.max_requests_per_user_per_hour = 10
+        mock_redis_from_url.return_value = self.mock_redis
+
+        first = RedisRateLimiter()
+        second = RedisRateLimiter()
+
+        assert first._redis is second._redis
+        assert first._gcra_script is second._gcra_script
+        mock_redis_from_url.assert_called_once()
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_check_limit_new_user(self, mock_redis_from_url, mock_settings) -> None:
         """Test checking limit for new user (should pass)."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -86,7 +144,7 @@ class TestRedisRateLimiter:
         assert result is True
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_check_limit_within_limits(self, mock_redis_from_url, mock_settings) -> None:
         """Test checking limit for user within limits."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -97,44 +155,34 @@ class TestRedisRateLimiter:
         rate_limiter = RedisRateLimiter()
 
         # Simulate some usage
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        
-        self.mock_redis.data[daily_key] = "5"
-        self.mock_redis.data[hourly_key] = "3"
+        for _ in range(5):
+            await rate_limiter.increment_usage(self.user_id)
 
         # Should still pass
         result = await rate_limiter.check_limit(self.user_id)
         assert result is True
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_check_limit_daily_limit_exceeded(self, mock_redis_from_url, mock_settings) -> None:
         """Test checking limit when daily limit is exceeded."""
         mock_settings.redis_url = "redis://localhost:6379"
-        mock_settings.max_requests_per_user_per_day = 10
+        mock_settings.max_requests_per_user_per_day = 3
         mock_settings.max_requests_per_user_per_hour = 5
         mock_redis_from_url.return_value = self.mock_redis
 
         rate_limiter = RedisRateLimiter()
 
-        # Simulate daily limit exceeded
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        
-        self.mock_redis.data[daily_key] = "10"  # At limit
-        self.mock_redis.data[hourly_key] = "2"
+        # Use up the daily burst
+        for _ in range(3):
+            await rate_limiter.increment_usage(self.user_id)
 
         # Should fail
         result = await rate_limiter.check_limit(self.user_id)
         assert result is False
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_check_limit_hourly_limit_exceeded(self, mock_redis_from_url, mock_settings) -> None:
         """Test checking limit when hourly limit is exceeded."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -144,23 +192,18 @@ class TestRedisRateLimiter:
 
         rate_limiter = RedisRateLimiter()
 
-        # Simulate hourly limit exceeded
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        
-        self.mock_redis.data[daily_key] = "20"
-        self.mock_redis.data[hourly_key] = "5"  # At limit
+        # Use up the hourly burst
+        for _ in range(5):
+            await rate_limiter.increment_usage(self.user_id)
 
         # Should fail
         result = await rate_limiter.check_limit(self.user_id)
         assert result is False
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_increment_usage(self, mock_redis_from_url, mock_settings) -> None:
-        """Test incrementing usage counters."""
+        """Test incrementing usage."""
         mock_settings.redis_url = "redis://localhost:6379"
         mock_settings.max_requests_per_user_per_day = 100
         mock_settings.max_requests_per_user_per_hour = 10
@@ -171,21 +214,16 @@ class TestRedisRateLimiter:
         # Increment usage
         await rate_limiter.increment_usage(self.user_id)
 
-        # Check that counters were incremented
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-
-        assert self.mock_redis.data[daily_key] == "1"
-        assert self.mock_redis.data[hourly_key] == "1"
+        # Check that one request was consumed from both envelopes
+        remaining = await rate_limiter.get_remaining_requests(self.user_id)
+        assert remaining["daily_remaining"] == 99
+        assert remaining["hourly_remaining"] == 9
 
         # Check that expiration was set
-        assert daily_key in self.mock_redis.expires
-        assert hourly_key in self.mock_redis.expires
+        assert f"rl:{self.user_id.hex}" in self.mock_redis.expires
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_increment_usage_multiple_times(self, mock_redis_from_url, mock_settings) -> None:
         """Test incrementing usage multiple times."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -199,17 +237,48 @@ class TestRedisRateLimiter:
         for _ in range(5):
             await rate_limiter.increment_usage(self.user_id)
 
-        # Check final counter values
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
+        remaining = await rate_limiter.get_remaining_requests(self.user_id)
+        assert remaining["daily_remaining"] == 95
+        assert remaining["hourly_remaining"] == 5
+
+    @patch("infrastructure.cache.rate_limiter.settings")
+    @patch("infrastructure.cache.redis.Redis.from_url")
+    async def test_reserve_admits_until_limit(self, mock_redis_from_url, mock_settings) -> None:
+        """Test reserving requests stops at the limit without overcounting."""
+        mock_settings.redis_url = "redis://localhost:6379"
+        mock_settings.max_requests_per_user_per_day = 10
+        mock_settings.max_requests_per_user_per_hour = 2
+        mock_redis_from_url.return_value = self.mock_redis
+
+        rate_limiter = RedisRateLimiter()
+
+        assert await rate_limiter.reserve(self.user_id) is True
+        assert await rate_limiter.reserve(self.user_id) is True
+        assert await rate_limiter.reserve(self.user_id) is False
 
-        assert self.mock_redis.data[daily_key] == "5"
-        assert self.mock_redis.data[hourly_key] == "5"
+        # Rejected reservation must not consume quota
+        remaining = await rate_limiter.get_remaining_requests(self.user_id)
+        assert remaining["daily_remaining"] == 8
+        assert remaining["hourly_remaining"] == 0
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
+    async def test_check_and_increment_reports_remaining(self, mock_redis_from_url, mock_settings) -> None:
+        """Test the combined check reports remaining quota for both windows."""
+        mock_settings.redis_url = "redis://localhost:6379"
+        mock_settings.max_requests_per_user_per_day = 3
+        mock_settings.max_requests_per_user_per_hour = 5
+        mock_redis_from_url.return_value = self.mock_redis
+
+        rate_limiter = RedisRateLimiter()
+
+        assert await rate_limiter.check_and_increment(self.user_id) == (True, 2, 4)
+        assert await rate_limiter.check_and_increment(self.user_id) == (True, 1, 3)
+        assert await rate_limiter.check_and_increment(self.user_id) == (True, 0, 2)
+        assert await rate_limiter.check_and_increment(self.user_id) == (False, 0, 2)
+
+    @patch("infrastructure.cache.rate_limiter.settings")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_get_remaining_requests_new_user(self, mock_redis_from_url, mock_settings) -> None:
         """Test getting remaining requests for new user."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -227,7 +296,7 @@ class TestRedisRateLimiter:
         assert result["hourly_limit"] == 10
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_get_remaining_requests_with_usage(self, mock_redis_from_url, mock_settings) -> None:
         """Test getting remaining requests after some usage."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -238,66 +307,59 @@ class TestRedisRateLimiter:
         rate_limiter = RedisRateLimiter()
 
         # Simulate some usage
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        
-        self.mock_redis.data[daily_key] = "25"
-        self.mock_redis.data[hourly_key] = "7"
+        for _ in range(7):
+            await rate_limiter.increment_usage(self.user_id)
 
         result = await rate_limiter.get_remaining_requests(self.user_id)
 
-        assert result["daily_remaining"] == 75
+        assert result["daily_remaining"] == 93
         assert result["hourly_remaining"] == 3
         assert result["daily_limit"] == 100
         assert result["hourly_limit"] == 10
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_get_remaining_requests_limit_exceeded(self, mock_redis_from_url, mock_settings) -> None:
         """Test getting remaining requests when limits are exceeded."""
         mock_settings.redis_url = "redis://localhost:6379"
-        mock_settings.max_requests_per_user_per_day = 100
-        mock_settings.max_requests_per_user_per_hour = 10
+        mock_settings.max_requests_per_user_per_day = 10
+        mock_settings.max_requests_per_user_per_hour = 5
         mock_redis_from_url.return_value = self.mock_redis
 
         rate_limiter = RedisRateLimiter()
 
         # Simulate limits exceeded
-        user_id_str = str(self.user_id)
-        now = datetime.utcnow()
-        daily_key = f"rate_limit:daily:{user_id_str}:{now.date()}"
-        hourly_key = f"rate_limit:hourly:{user_id_str}:{now.strftime('%Y%m%d%H')}"
-        
-        self.mock_redis.data[daily_key] = "150"  # Over daily limit
-        self.mock_redis.data[hourly_key] = "15"  # Over hourly limit
+        for _ in range(12):
+            await rate_limiter.increment_usage(self.user_id)
 
         result = await rate_limiter.get_remaining_requests(self.user_id)
 
-        assert result["daily_remaining"] == 0  # Should not go negative
+        assert result["daily_remaining"] == 5  # Rejected requests are not counted
         assert result["hourly_remaining"] == 0  # Should not go negative
-        assert result["daily_limit"] == 100
-        assert result["hourly_limit"] == 10
+        assert result["daily_limit"] == 10
+        assert result["hourly_limit"] == 5
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_close_connection(self, mock_redis_from_url, mock_settings) -> None:
-        """Test closing Redis connection."""
+        """Test closing the shared Redis connection."""
         mock_settings.redis_url = "redis://localhost:6379"
         mock_settings.max_requests_per_user_per_day = 100
         mock_settings.max_requests_per_user_per_hour = 10
         mock_redis_from_url.return_value = self.mock_redis
 
-        rate_limiter = RedisRateLimiter()
+        RedisRateLimiter()
 
-        # Should not raise an exception
-        await rate_limiter.close()
+        # Should not raise an exception, and the next limiter reconnects
+        await close_redis()
+        await close_redis()
+        RedisRateLimiter()
+        assert mock_redis_from_url.call_count == 2
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_key_format_consistency(self, mock_redis_from_url, mock_settings) -> None:
-        """Test that rate limiter uses consistent key formats."""
+        """Test that rate limiter keeps one key per user."""
         mock_settings.redis_url = "redis://localhost:6379"
         mock_settings.max_requests_per_user_per_day = 100
         mock_settings.max_requests_per_user_per_hour = 10
@@ -305,25 +367,13 @@ class TestRedisRateLimiter:
 
         rate_limiter = RedisRateLimiter()
 
-        # Use a fixed datetime for consistent testing
-        fixed_datetime = datetime(2024, 1, 15, 14, 30, 0)
-        
-        with patch("infrastructure.cache.rate_limiter.datetime") as mock_datetime:
-            mock_datetime.utcnow.return_value = fixed_datetime
-            mock_datetime.date = datetime.date
-
-            await rate_limiter.increment_usage(self.user_id)
-            
-            # Check that expected keys were created
-            user_id_str = str(self.user_id)
-            expected_daily_key = f"rate_limit:daily:{user_id_str}:2024-01-15"
-            expected_hourly_key = f"rate_limit:hourly:{user_id_str}:20240115014"
+        await rate_limiter.increment_usage(self.user_id)
 
-            assert expected_daily_key in self.mock_redis.data
-            assert expected_hourly_key in self.mock_redis.data
+        assert list(self.mock_redis.data) == [f"rl:{self.user_id.hex}"]
+        assert set(self.mock_redis.data[f"rl:{self.user_id.hex}"]) == {"day", "hour"}
 
     @patch("infrastructure.cache.rate_limiter.settings")
-    @patch("infrastructure.cache.rate_limiter.Redis.from_url")
+    @patch("infrastructure.cache.redis.Redis.from_url")
     async def test_multiple_users_isolation(self, mock_redis_from_url, mock_settings) -> None:
         """Test that different users have isolated rate limits."""
         mock_settings.redis_url = "redis://localhost:6379"
@@ -350,6 +400,212 @@ class TestRedisRateLimiter:
         assert remaining["hourly_remaining"] == 5
 
 
+class TestUserLookupCache:
+    """Telegram ID lookup cache in the user repository."""
+
+    def setup_method(self) -> None:
+        """Set up test dependencies."""
+        self.cache = MockRedis()
+        self.session = AsyncMock()
+        self.session.info = {}
+        self.repository = SQLAlchemyUserRepository(self.session, self.cache)
+        self.user = User.create(123456789, "parent", "Anna", "Petrova")
+        self.user.add_child("Masha", date(2018, 5, 1), Gender.FEMALE, "likes drawing")
+
+    def _query_returns(self, user: User | None) -> None:
+        db_user = None
+        if user is not None:
+            db_user = Mock(
+                id=user.id,
+                telegram_id=user.telegram_user.telegram_id,
+                username=user.telegram_user.username,
+                first_name=user.telegram_user.first_name,
+                last_name=user.telegram_user.last_name,
+                language_code=user.telegram_user.language_code,
+                children=[
+                    Mock(
+                        id=child.id,
+                        birth_date=child.birth_date,
+                        gender=child.gender,
+                        notes=child.notes,
+                    )
+                    for child in user.children
+                ],
+                onboarding_completed=user.onboarding_completed,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                is_active=user.is_active,
+            )
+            for db_child, child in zip(db_user.children, user.children):
+                db_child.name = child.name
+        result = Mock()
+        result.scalar_one_or_none.return_value = db_user
+        self.session.execute.return_value = result
+
+    async def test_miss_queries_database_and_populates_cache(self) -> None:
+        """A miss reads Postgres once and caches the aggregate."""
+        self._query_returns(self.user)
+
+        user = await self.repository.get_by_telegram_id(123456789)
+
+        assert user.id == self.user.id
+        assert self.session.execute.await_count == 1
+        assert f"{USER_CACHE_PREFIX}123456789" in self.cache.data
+
+    async def test_hit_skips_database(self) -> None:
+        """A hit rebuilds the aggregate without touching the session."""
+        self._query_returns(self.user)
+        await self.repository.get_by_telegram_id(123456789)
+        self.session.execute.reset_mock()
+
+        user = await self.repository.get_by_telegram_id(123456789)
+
+        self.session.execute.assert_not_awaited()
+        assert user.id == self.user.id
+        assert user.telegram_user == self.user.telegram_user
+        assert user.created_at == self.user.created_at
+        (child,) = user.children
+        (expected,) = self.user.children
+        assert child == expected
+        assert child.gender is Gender.FEMALE
+        assert user.get_child(expected.id) == expected
+
+    async def test_unknown_user_is_not_cached(self) -> None:
+        """Missing users are looked up again next time."""
+        self._query_returns(None)
+
+        assert await self.repository.get_by_telegram_id(1) is None
+        assert self.cache.data == {}
+
+    async def test_save_invalidates(self) -> None:
+        """Saving a user drops its cached copy."""
+        self._query_returns(self.user)
+        await self.repository.get_by_telegram_id(123456789)
+
+        await self.repository.save(self.user)
+
+        # The cached copy stays until the transaction commits
+        assert f"{USER_CACHE_PREFIX}123456789" in self.cache.data
+        await run_after_commit(self.session)
+        assert self.cache.data == {}
+
+    async def test_delete_invalidates(self) -> None:
+        """Deleting a user drops its cached copy."""
+        self._query_returns(self.user)
+        await self.repository.get_by_telegram_id(123456789)
+        deleted = Mock()
+        deleted.scalar_one_or_none.return_value = 123456789
+        self.session.execute.return_value = deleted
+
+        await self.repository.delete(self.user.id)
+        await run_after_commit(self.session)
+
+        assert self.cache.data == {}
+
+
+class TestPersistenceUserLookupCache:
+    """Telegram ID lookup cache in the persistence user repository."""
+
+    async def test_hit_skips_database_and_save_invalidates(self) -> None:
+        """A cached user is rebuilt without a query until it is saved."""
+        from src.domain.user.aggregates import User as PersistedUser
+        from src.infrastructure.persistence.user_repository import (
+            USER_CACHE_PREFIX as PERSISTENCE_PREFIX,
+            SqlAlchemyUserRepository,
+        )
+
+        user = PersistedUser.register(
+            telegram_id=987654321,
+            name="Anna",
+            child_name="Masha",
+            child_age=5,
+            child_gender="female",
+        )
+        (child,) = user.children
+        db_child = Mock(id=child.id, age=child.age, gender=child.gender, created_at=child.created_at)
+        db_child.name = child.name
+        db_user = Mock(
+            id=user.id,
+            telegram_id=987654321,
+            children=[db_child],
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            is_active=True,
+        )
+        db_user.name = "Anna"
+        result = Mock()
+        result.scalar_one_or_none.return_value = db_user
+        session = AsyncMock()
+        session.execute.return_value = result
+        session.identity_map = Mock(get=Mock(return_value=None))
+        session.info = {}
+        cache = MockRedis()
+        repository = SqlAlchemyUserRepository(session, cache)
+
+        await repository.get_by_telegram_id(987654321)
+        session.execute.reset_mock()
+        cached = await repository.get_by_telegram_id(987654321)
+
+        session.execute.assert_not_awaited()
+        assert cached.id == user.id
+        assert cached.children == user.children
+        assert f"{PERSISTENCE_PREFIX}987654321" in cache.data
+
+        await repository.save(user)
+
+        assert f"{PERSISTENCE_PREFIX}987654321" in cache.data
+        await run_after_commit(session)
+        assert cache.data == {}
+
+
+class TestGcraScript:
+    """GCRA_SCRIPT executed by fakeredis' embedded Lua interpreter."""
+
+    @pytest.fixture
+    def redis(self):
+        """Fake Redis server that runs Lua scripts."""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    def _limiter(self, redis, daily: int, hourly: int) -> RedisRateLimiter:
+        _gcra_script.cache_clear()
+        with patch("infrastructure.cache.rate_limiter.get_redis", return_value=redis), \
+                patch("infrastructure.cache.rate_limiter.settings") as mock_settings:
+            mock_settings.max_requests_per_user_per_day = daily
+            mock_settings.max_requests_per_user_per_hour = hourly
+            return RedisRateLimiter()
+
+    async def test_admits_until_either_envelope_is_spent(self, redis) -> None:
+        """The hourly envelope runs out first and blocks further requests."""
+        rate_limiter = self._limiter(redis, daily=3, hourly=2)
+        user_id = uuid4()
+
+        assert await rate_limiter.check_and_increment(user_id) == (True, 2, 1)
+        assert await rate_limiter.check_and_increment(user_id) == (True, 1, 0)
+        assert await rate_limiter.check_and_increment(user_id) == (False, 1, 0)
+        assert await redis.pttl(f"{KEY_PREFIX}{user_id.hex}") > 0
+
+    async def test_check_limit_does_not_consume(self, redis) -> None:
+        """Checking without commit leaves the stored arrival times alone."""
+        rate_limiter = self._limiter(redis, daily=3, hourly=2)
+        user_id = uuid4()
+
+        assert await rate_limiter.check_limit(user_id) is True
+        assert await rate_limiter.check_limit(user_id) is True
+
+        remaining = await rate_limiter.get_remaining_requests(user_id)
+        assert remaining["daily_remaining"] == 3
+        assert remaining["hourly_remaining"] == 2
+        assert await redis.exists(f"{KEY_PREFIX}{user_id.hex}") == 0
+
+    async def test_zero_limit_denies_every_request(self, redis) -> None:
+        """A limit of 0 denies requests instead of failing to build."""
+        rate_limiter = self._limiter(redis, daily=0, hourly=10)
+
+        assert await rate_limiter.check_and_increment(uuid4()) == (False, 0, 10)
+
+
 class TestRedisIntegrationWithRealRedis:
     """Integration tests with real Redis (if available)."""
 
@@ -379,12 +635,14 @@ class TestRedisIntegrationWithRealRedis:
     @pytest.mark.integration
     async def test_redis_connection_failure_handling(self) -> None:
         """Test handling of Redis connection failures."""
-        with patch("infrastructure.cache.rate_limiter.Redis.from_url") as mock_redis_from_url:
+        with patch("infrastructure.cache.redis.Redis.from_url") as mock_redis_from_url:
             # Mock Redis to raise connection errors
             mock_redis = Mock()
-            mock_redis.get = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
-            mock_redis.incr = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+            mock_redis.register_script.return_value = AsyncMock(
+                side_effect=ConnectionError("Redis unavailable")
+            )
             mock_redis_from_url.return_value = mock_redis
+            get_redis.cache_clear()
             
             with patch("infrastructure.cache.rate_limiter.settings") as mock_settings:
                 mock_settings.redis_url = "redis://localhost:6379"
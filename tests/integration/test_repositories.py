@@ -5,6 +5,8 @@ from datetime import date
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from domain.aggregates.situation import Situation
 from domain.aggregates.user import User
@@ -511,4 +513,58 @@ class TestRepositoryTransactions:
             retrieved_user = await repository.get_by_telegram_id(123456789 + i)
             assert retrieved_user is not None
             assert retrieved_user.id == original_user.id
-            assert retrieved_user.telegram_user.username == f"user{i}"
\ No newline at end of file
+            assert retrieved_user.telegram_user.username == f"user{i}"
+
+
+class TestSQLAlchemyRepositoriesOnSqlite:
+    """Upserts in infrastructure.database.repositories on the SQLite test engine."""
+
+    @pytest_asyncio.fixture
+    async def session(self):
+        """Session on an in-memory SQLite database with the bot's tables."""
+        from infrastructure.database.models import Base
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+        await engine.dispose()
+
+    async def test_save_twice_updates_in_place(self, session) -> None:
+        """Test that saving existing aggregates again updates their rows."""
+        from infrastructure.database.repositories import (
+            SQLAlchemySituationRepository,
+            SQLAlchemyUserRepository,
+        )
+
+        users = SQLAlchemyUserRepository(session)
+        situations = SQLAlchemySituationRepository(session)
+        user = User.create(telegram_id=123456789, username="testuser", first_name="John")
+        child = user.add_child(name="Alice", birth_date=date(2018, 5, 15), gender=Gender.FEMALE)
+        await users.save(user)
+        situation = Situation.create(
+            user_id=user.id,
+            child_id=child.id,
+            description="Ребенок не хочет делать уроки",
+        )
+        await situations.save(situation)
+
+        user.complete_onboarding()
+        user.add_child(name="Bob", birth_date=date(2020, 1, 10), gender=Gender.MALE)
+        await users.save(user)
+        situation.apply_analysis(
+            hidden_meaning="Test",
+            immediate_actions=["Action"],
+            long_term_recommendations=["Recommendation"],
+            what_not_to_do=["Don't"],
+            emotional_tone=EmotionalTone.NEUTRAL,
+        )
+        await situations.save(situation)
+        await session.commit()
+
+        retrieved_user = await users.get_by_telegram_id(123456789)
+        assert retrieved_user.onboarding_completed
+        assert sorted(c.name for c in retrieved_user.children) == ["Alice", "Bob"]
+        retrieved = await situations.get(situation.id)
+        assert retrieved.analysis_result.immediate_actions == ("Action",)
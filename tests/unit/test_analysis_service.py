@@ -85,8 +85,9 @@ class MockUserRepository:
 class MockSituationRepository:
     """Mock situation repository for testing."""
 
-    def __init__(self):
+    def __init__(self, user_repository: MockUserRepository | None = None):
         self.situations: dict[UUID, Situation] = {}
+        self.user_repository = user_repository
 
     async def save(self, situation: Situation) -> None:
         """Save situation."""
@@ -105,6 +106,15 @@ class MockSituationRepository:
         ]
         return user_situations[offset : offset + limit]
 
+    async def get_user_situations_with_child_names(
+        self, user_id: UUID, limit: int = 10, offset: int = 0
+    ) -> list[tuple[Situation, str | None]]:
+        """Get user situations with child names."""
+        user = self.user_repository.users.get(user_id) if self.user_repository else None
+        child_names = {c.id: c.name for c in user.children} if user else {}
+        situations = await self.get_user_situations(user_id, limit, offset)
+        return [(s, child_names.get(s.child_id)) for s in situations]
+
 
 class TestAnalysisService:
     """Analysis service test cases."""
@@ -112,7 +122,7 @@ class TestAnalysisService:
     def setup_method(self) -> None:
         """Set up test dependencies."""
         self.user_repository = MockUserRepository()
-        self.situation_repository = MockSituationRepository()
+        self.situation_repository = MockSituationRepository(self.user_repository)
         self.claude_adapter = MockClaudeAdapter()
         self.analysis_service = AnalysisService(
             self.user_repository,
@@ -155,13 +165,13 @@ class TestAnalysisService:
         assert result.is_analyzed
 
         # Check analysis result
-        assert result.analysis_result is not None
-        assert result.analysis_result.hidden_meaning == "Ребенок устал и нуждается в отдыхе"
-        assert len(result.analysis_result.immediate_actions) == 2
-        assert len(result.analysis_result.long_term_recommendations) == 2
-        assert len(result.analysis_result.what_not_to_do) == 2
-        assert result.analysis_result.emotional_tone == EmotionalTone.CONCERNING
-        assert result.analysis_result.confidence_score == 0.85
+        assert result.hidden_meaning is not None
+        assert result.hidden_meaning == "Ребенок устал и нуждается в отдыхе"
+        assert len(result.immediate_actions) == 2
+        assert len(result.long_term_recommendations) == 2
+        assert len(result.what_not_to_do) == 2
+        assert result.emotional_tone == EmotionalTone.CONCERNING
+        assert result.confidence_score == 0.85
 
         # Check Claude adapter was called correctly
         assert self.claude_adapter.call_count == 1
@@ -522,8 +532,8 @@ class TestAnalysisService:
 
         result = await self.analysis_service.analyze_situation(command)
 
-        assert result.analysis_result is not None
-        assert result.analysis_result.emotional_tone == expected_tone
+        assert result.hidden_meaning is not None
+        assert result.emotional_tone == expected_tone
 
 
 class TestAnalysisServiceWithMocks:
@@ -534,7 +544,8 @@ class TestAnalysisServiceWithMocks:
         self.mock_user_repository = Mock(spec=UserRepository)
         self.mock_situation_repository = Mock(spec=SituationRepository)
         self.mock_claude_adapter = Mock(spec=ClaudeAdapter)
-        
+        self.mock_claude_adapter.analyze_situation = AsyncMock()
+
         self.analysis_service = AnalysisService(
             self.mock_user_repository,
             self.mock_situation_repository,
@@ -559,16 +570,14 @@ class TestAnalysisServiceWithMocks:
         # Setup mocks
         self.mock_user_repository.get = AsyncMock(return_value=user)
         self.mock_situation_repository.save = AsyncMock()
-        self.mock_claude_adapter.analyze_situation = AsyncMock(
-            return_value={
-                "hidden_meaning": "Test meaning",
-                "immediate_actions": ["Action"],
-                "long_term_recommendations": ["Rec"],
-                "what_not_to_do": ["Don't"],
-                "emotional_tone": "neutral",
-                "confidence_score": 0.8,
-            }
-        )
+        self.mock_claude_adapter.analyze_situation.return_value = {
+            "hidden_meaning": "Test meaning",
+            "immediate_actions": ["Action"],
+            "long_term_recommendations": ["Rec"],
+            "what_not_to_do": ["Don't"],
+            "emotional_tone": "neutral",
+            "confidence_score": 0.8,
+        }
 
         command = AnalyzeSituationCommand(
             user_id=user.id,
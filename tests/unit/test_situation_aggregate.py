@@ -83,6 +83,29 @@ class TestSituationAggregate:
         assert len(events) == 1
         assert isinstance(events[0], SituationAnalyzed)
         assert events[0].emotional_tone == EmotionalTone.CONCERNING
+        assert events[0].occurred_at == situation.analyzed_at
+        assert situation.analysis_result.analyzed_at == situation.analyzed_at
+
+    def test_apply_analysis_copies_lists(self) -> None:
+        """Test that the stored result does not alias the caller's lists."""
+        situation = Situation.create(
+            user_id=uuid4(),
+            child_id=uuid4(),
+            description="Ребенок не хочет делать уроки",
+        )
+        actions = ["Дать отдохнуть"]
+
+        situation.apply_analysis(
+            hidden_meaning="Test",
+            immediate_actions=actions,
+            long_term_recommendations=["Recommendation"],
+            what_not_to_do=["Don't"],
+            emotional_tone=EmotionalTone.NEUTRAL,
+        )
+        actions.append("Накричать")
+
+        assert situation.analysis_result.immediate_actions == ("Дать отдохнуть",)
+        assert isinstance(situation.analysis_result.what_not_to_do, tuple)
 
     def test_cannot_analyze_twice(self) -> None:
         """Test that situation cannot be analyzed twice."""
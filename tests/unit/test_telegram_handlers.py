@@ -38,7 +38,7 @@ class TestStartHandler:
             first_name="John",
             last_name="Doe",
             full_name="John Doe",
-            children=[],
+            children=(),
             onboarding_completed=True,
             created_at="2024-01-01T00:00:00",
             is_active=True,
@@ -171,7 +171,7 @@ class TestRegistrationHandler:
             first_name="Test Parent Name",
             last_name=None,
             full_name="Test Parent Name",
-            children=[],
+            children=(),
             onboarding_completed=False,
             created_at="2024-01-01T00:00:00",
             is_active=True,
@@ -140,6 +140,31 @@ class TestUserAggregate:
         # Non-existent child
         assert user.get_child(uuid4()) is None
 
+    def test_get_child_after_reconstitution(self) -> None:
+        """Test children passed to the constructor are indexed."""
+        user = User.create(
+            telegram_id=123456,
+            username="testuser",
+            first_name="John",
+        )
+        child = user.add_child(
+            name="Alice",
+            birth_date=date(2018, 5, 15),
+            gender=Gender.FEMALE,
+        )
+
+        restored = User(
+            id=user.id,
+            telegram_user=user.telegram_user,
+            children=list(user.children),
+        )
+
+        assert restored.get_child(child.id) == child
+
+        restored.remove_child(child.id)
+        assert restored.get_child(child.id) is None
+        assert restored.children == []
+
     def test_deactivate_and_activate_user(self) -> None:
         """Test user deactivation and activation."""
         user = User.create(
@@ -162,4 +187,15 @@ class TestUserAggregate:
             )
 
         user.activate()
-        assert user.is_active
\ No newline at end of file
+        assert user.is_active
+
+    def test_clear_events(self) -> None:
+        """Test dropping pending events."""
+        user = User.create(
+            telegram_id=123456,
+            username="testuser",
+            first_name="John",
+        )
+
+        user.clear_events()
+        assert user.collect_events() == []
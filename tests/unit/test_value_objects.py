@@ -2,10 +2,19 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
+from uuid import uuid4
 
 import pytest
 
-from domain.value_objects import AnalysisResult, ChildAge, EmotionalTone, Gender
+from domain.value_objects import (
+    AnalysisResult,
+    Child,
+    ChildAge,
+    EmotionalTone,
+    Gender,
+    _age_on,
+    _age_parts_on,
+)
 
 
 class TestChildAge:
@@ -56,6 +65,47 @@ class TestChildAge:
         assert ChildAge(years=17).age_group == "teenager"
 
 
+class TestChild:
+    """Child value object tests."""
+
+    def test_age_parts_match_age(self) -> None:
+        """Test age parts agree with the computed age."""
+        child = Child(
+            id=uuid4(),
+            name="Alice",
+            birth_date=date(2018, 5, 15),
+            gender=Gender.FEMALE,
+        )
+        age = child.age
+
+        assert child.age_parts == (age.years, age.months or 0, age.age_group)
+        assert child.age_parts is child.age_parts
+
+    def test_age_parts_follow_the_calendar(self) -> None:
+        """Test age parts move on with the day like age does."""
+        birth_date = date(2018, 5, 15)
+
+        assert _age_parts_on(birth_date, date(2024, 5, 14)) == (5, 11, "preschooler")
+        assert _age_parts_on(birth_date, date(2024, 5, 15)) == (6, 0, "school_age")
+
+    @pytest.mark.parametrize(
+        "today,expected",
+        [
+            (date(2024, 5, 15), (6, 0)),
+            (date(2024, 5, 14), (5, 11)),
+            (date(2024, 7, 14), (6, 1)),
+            (date(2024, 3, 20), (5, 10)),
+        ],
+    )
+    def test_age_counts_completed_months(
+        self, today: date, expected: tuple[int, int]
+    ) -> None:
+        """Test a month only counts once its day has been reached."""
+        age = _age_on(date(2018, 5, 15), today)
+
+        assert (age.years, age.months) == expected
+
+
 class TestAnalysisResult:
     """AnalysisResult value object tests."""
 
@@ -348,8 +348,9 @@ class TestEnums:
 
     def test_enum_string_representation(self) -> None:
         """Test enum string representations."""
-        assert str(Gender.MALE) == "Gender.MALE"
-        assert str(EmotionalTone.POSITIVE) == "EmotionalTone.POSITIVE"
+        assert str(Gender.MALE) == "male"
+        assert str(EmotionalTone.POSITIVE) == "positive"
+        assert Gender.MALE == "male"
         
         # Test representation
         assert repr(Gender.FEMALE) == "<Gender.FEMALE: 'female'>"